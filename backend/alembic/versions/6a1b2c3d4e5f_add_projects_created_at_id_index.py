@@ -0,0 +1,28 @@
+"""add projects created_at/id index
+
+Revision ID: 6a1b2c3d4e5f
+Revises: 0bf19790dfac
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6a1b2c3d4e5f"
+down_revision: Union[str, Sequence[str], None] = "0bf19790dfac"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_projects_created_at_id", "projects", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_projects_created_at_id", table_name="projects")
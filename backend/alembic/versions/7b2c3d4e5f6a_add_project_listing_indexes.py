@@ -0,0 +1,42 @@
+"""add project listing indexes
+
+Revision ID: 7b2c3d4e5f6a
+Revises: 6a1b2c3d4e5f
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2c3d4e5f6a"
+down_revision: Union[str, Sequence[str], None] = "6a1b2c3d4e5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_projects_owner_created_at", "projects", ["owner_id", "created_at", "id"]
+    )
+    op.create_index(
+        "idx_projects_status_created_at", "projects", ["status", "created_at", "id"]
+    )
+    op.create_index(
+        "idx_projects_public_created_at",
+        "projects",
+        ["created_at", "id"],
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_projects_public_created_at", table_name="projects")
+    op.drop_index("idx_projects_status_created_at", table_name="projects")
+    op.drop_index("idx_projects_owner_created_at", table_name="projects")
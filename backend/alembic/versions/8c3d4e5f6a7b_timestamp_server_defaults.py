@@ -0,0 +1,43 @@
+"""timestamp server defaults
+
+Revision ID: 8c3d4e5f6a7b
+Revises: 7b2c3d4e5f6a
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c3d4e5f6a7b"
+down_revision: Union[str, Sequence[str], None] = "7b2c3d4e5f6a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMPED_TABLES = (
+    "users",
+    "projects",
+    "reviews",
+    "project_files",
+    "comment_threads",
+    "thread_comments",
+    "notifications",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TIMESTAMPED_TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(table, column, server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TIMESTAMPED_TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(table, column, server_default=None)
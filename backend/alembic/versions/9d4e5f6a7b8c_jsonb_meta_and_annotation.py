@@ -0,0 +1,72 @@
+"""jsonb meta and annotation
+
+Revision ID: 9d4e5f6a7b8c
+Revises: 8c3d4e5f6a7b
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4e5f6a7b8c"
+down_revision: Union[str, Sequence[str], None] = "8c3d4e5f6a7b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "analytics",
+        "meta",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using="meta::jsonb",
+    )
+    op.alter_column(
+        "comment_threads",
+        "annotation",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using="annotation::jsonb",
+    )
+    op.create_index(
+        "idx_analytics_meta_gin",
+        "analytics",
+        ["meta"],
+        postgresql_using="gin",
+        postgresql_ops={"meta": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "idx_comment_threads_annotation_gin",
+        "comment_threads",
+        ["annotation"],
+        postgresql_using="gin",
+        postgresql_ops={"annotation": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_comment_threads_annotation_gin", table_name="comment_threads")
+    op.drop_index("idx_analytics_meta_gin", table_name="analytics")
+    op.alter_column(
+        "comment_threads",
+        "annotation",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using="annotation::json",
+    )
+    op.alter_column(
+        "analytics",
+        "meta",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using="meta::json",
+    )
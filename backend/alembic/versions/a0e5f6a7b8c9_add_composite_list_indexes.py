@@ -0,0 +1,47 @@
+"""add composite list indexes
+
+Revision ID: a0e5f6a7b8c9
+Revises: 9d4e5f6a7b8c
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a0e5f6a7b8c9"
+down_revision: Union[str, Sequence[str], None] = "9d4e5f6a7b8c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The composite indexes lead with the same column, so they replace the single-column ones.
+    op.create_index(
+        "idx_thread_comments_thread_created", "thread_comments", ["thread_id", "created_at"]
+    )
+    op.drop_index("idx_thread_comments_thread", table_name="thread_comments")
+    op.create_index(
+        "idx_analytics_proj_event_ts",
+        "analytics",
+        ["project_id", "event_type", "event_timestamp"],
+        postgresql_include=["user_id"],
+    )
+    op.drop_index("idx_analytics_project", table_name="analytics")
+    op.create_index("idx_reviews_project_created", "reviews", ["project_id", "created_at"])
+    op.drop_index("idx_reviews_project", table_name="reviews")
+    op.execute("ANALYZE thread_comments, analytics, reviews")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_reviews_project", "reviews", ["project_id"])
+    op.drop_index("idx_reviews_project_created", table_name="reviews")
+    op.create_index("idx_analytics_project", "analytics", ["project_id"])
+    op.drop_index("idx_analytics_proj_event_ts", table_name="analytics")
+    op.create_index("idx_thread_comments_thread", "thread_comments", ["thread_id"])
+    op.drop_index("idx_thread_comments_thread_created", table_name="thread_comments")
@@ -0,0 +1,33 @@
+"""lower fillfactor for hot updates
+
+Revision ID: a6e1f2a3b4c5
+Revises: f5d0e1f2a3b4
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "f5d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_UPDATE_HEAVY_TABLES = ("projects", "comment_threads")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Applies to newly written pages; existing pages fill up as rows are rewritten.
+    for table in _UPDATE_HEAVY_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _UPDATE_HEAVY_TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,29 @@
+"""drop projects public index
+
+Revision ID: b1f6a7b8c9d0
+Revises: a0e5f6a7b8c9
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b1f6a7b8c9d0"
+down_revision: Union[str, Sequence[str], None] = "a0e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Public listings use the partial idx_projects_public_created_at index instead.
+    op.drop_index("idx_projects_public", table_name="projects")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_projects_public", "projects", ["is_public"])
@@ -0,0 +1,29 @@
+"""drop comment threads project index
+
+Revision ID: b7f2a3b4c5d6
+Revises: a6e1f2a3b4c5
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "a6e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # idx_comment_threads_view (project_id, view_id) serves project_id lookups as a prefix.
+    op.drop_index("idx_comment_threads_project", table_name="comment_threads")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_comment_threads_project", "comment_threads", ["project_id"])
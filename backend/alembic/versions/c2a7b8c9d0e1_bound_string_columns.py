@@ -0,0 +1,48 @@
+"""bound string columns
+
+Revision ID: c2a7b8c9d0e1
+Revises: b1f6a7b8c9d0
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "b1f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, length); lengths mirror the API schema limits.
+_BOUNDED_COLUMNS = (
+    ("users", "display_name", 255),
+    ("users", "avatar_url", 500),
+    ("projects", "name", 255),
+    ("projects", "github_repo_url", 500),
+    ("projects", "secret_link", 128),
+    ("projects", "status", 50),
+    ("projects", "source_type", 50),
+    ("projects", "thumbnail_kind", 50),
+    ("projects", "processing_status", 50),
+    ("reviews", "target_file", 255),
+    ("reviews", "target_component", 255),
+    ("analytics", "event_type", 64),
+    ("comment_threads", "view_id", 100),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, length in _BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length), existing_type=sa.String())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, length in _BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(), existing_type=sa.String(length))
@@ -0,0 +1,28 @@
+"""add thread comments parent index
+
+Revision ID: c8a3b4c5d6e7
+Revises: b7f2a3b4c5d6
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "b7f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_thread_comments_parent", "thread_comments", ["parent_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_thread_comments_parent", table_name="thread_comments")
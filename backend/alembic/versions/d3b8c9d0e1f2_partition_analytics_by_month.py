@@ -0,0 +1,105 @@
+"""partition analytics by month
+
+Revision ID: d3b8c9d0e1f2
+Revises: c2a7b8c9d0e1
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "c2a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = "id, project_id, event_type, event_timestamp, user_id, meta"
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_analytics_table(primary_key: tuple[str, ...], **kwargs) -> None:
+    op.create_table(
+        "analytics",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("event_type", sa.String(64), nullable=False),
+        sa.Column("event_timestamp", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=True),
+        sa.Column("meta", postgresql.JSONB(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(*primary_key),
+        **kwargs,
+    )
+
+
+def _create_analytics_indexes() -> None:
+    op.create_index(
+        "idx_analytics_proj_event_ts",
+        "analytics",
+        ["project_id", "event_type", "event_timestamp"],
+        postgresql_include=["user_id"],
+    )
+    op.create_index("idx_analytics_event", "analytics", ["event_type"])
+    op.create_index(
+        "idx_analytics_meta_gin",
+        "analytics",
+        ["meta"],
+        postgresql_using="gin",
+        postgresql_ops={"meta": "jsonb_path_ops"},
+    )
+
+
+def _set_aside_analytics_table(new_name: str) -> None:
+    op.rename_table("analytics", new_name)
+    op.execute(f"ALTER TABLE {new_name} RENAME CONSTRAINT analytics_pkey TO {new_name}_pkey")
+    for index in ("idx_analytics_proj_event_ts", "idx_analytics_event", "idx_analytics_meta_gin"):
+        op.drop_index(index, table_name=new_name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_aside_analytics_table("analytics_unpartitioned")
+    _create_analytics_table(
+        ("id", "event_timestamp"), postgresql_partition_by="RANGE (event_timestamp)"
+    )
+
+    # Partitions from the oldest stored event through next month; later months are
+    # created on demand by the analytics writer.
+    current = datetime.now(UTC).date().replace(day=1)
+    oldest = (
+        op.get_bind()
+        .execute(sa.text("SELECT min(event_timestamp) FROM analytics_unpartitioned"))
+        .scalar()
+    )
+    month = min(oldest.astimezone(UTC).date().replace(day=1), current) if oldest else current
+    while month <= _next_month(current):
+        op.execute(
+            f"CREATE TABLE analytics_{month:%Y_%m} PARTITION OF analytics "
+            f"FOR VALUES FROM ('{month} 00:00:00+00') TO ('{_next_month(month)} 00:00:00+00')"
+        )
+        month = _next_month(month)
+
+    _create_analytics_indexes()
+    op.execute(f"INSERT INTO analytics ({_COLUMNS}) SELECT {_COLUMNS} FROM analytics_unpartitioned")
+    op.drop_table("analytics_unpartitioned")
+    op.execute("ANALYZE analytics")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_aside_analytics_table("analytics_partitioned")
+    _create_analytics_table(("id",))
+    _create_analytics_indexes()
+    op.execute(f"INSERT INTO analytics ({_COLUMNS}) SELECT {_COLUMNS} FROM analytics_partitioned")
+    # Dropping the partitioned parent drops its monthly partitions too.
+    op.drop_table("analytics_partitioned")
@@ -0,0 +1,29 @@
+"""analytics timestamp server default
+
+Revision ID: e4c9d0e1f2a3
+Revises: d3b8c9d0e1f2
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "d3b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column("analytics", "event_timestamp", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("analytics", "event_timestamp", server_default=None)
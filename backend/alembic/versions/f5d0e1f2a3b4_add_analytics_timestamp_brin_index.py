@@ -0,0 +1,34 @@
+"""add analytics timestamp brin index
+
+Revision ID: f5d0e1f2a3b4
+Revises: e4c9d0e1f2a3
+Create Date: 2026-10-16 17:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "e4c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "brin_analytics_ts",
+        "analytics",
+        ["event_timestamp"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("brin_analytics_ts", table_name="analytics")
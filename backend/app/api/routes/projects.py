@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import logging
 import pathlib
 from uuid import UUID
@@ -35,6 +36,7 @@ from app.api.schemas.projects import (
 from app.services.projects import (
     create_project,
     delete_project,
+    ensure_project_exists,
     get_project,
     list_projects,
     update_project,
@@ -52,6 +54,9 @@ from app.services.storage.base import StorageService, StorageError
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Preview SVGs are stored gzip-compressed; older uploads may still be plain text.
+_GZIP_MAGIC = b"\x1f\x8b"
+
 _MEDIA_TYPES = {
     ".svg": "image/svg+xml",
     ".glb": "model/gltf-binary",
@@ -120,6 +125,7 @@ async def create_project_endpoint(
 async def list_projects_endpoint(
     page: int = 1,
     size: int = 20,
+    cursor: str | None = None,
     only_public: bool | None = None,
     owner_id: UUID | None = None,
     status: str | None = None,
@@ -131,6 +137,7 @@ async def list_projects_endpoint(
         session,
         page=page,
         size=size,
+        cursor=cursor,
         only_public=only_public,
         owner_id=owner_id,
         status=status,
@@ -194,7 +201,7 @@ async def get_project_previews_endpoint(
     storage: StorageService = Depends(get_storage_service),
 ) -> ProjectPreviewResponse:
     """Get project previews."""
-    await get_project(session, project_id)
+    await ensure_project_exists(session, project_id)
 
     try:
         index = await load_preview_index(storage, project_id)
@@ -247,13 +254,14 @@ async def get_project_previews_endpoint(
 
 @router.get("/{project_id}/previews/{asset_path:path}")
 async def get_project_preview_asset(
+    request: Request,
     project_id: UUID,
     asset_path: str,
     session: AsyncSession = Depends(get_db_session),
     storage: StorageService = Depends(get_storage_service),
 ):
     """Get a project preview asset."""
-    await get_project(session, project_id)
+    await ensure_project_exists(session, project_id)
 
     try:
         storage_path = await validate_preview_asset_path(project_id, asset_path)
@@ -277,9 +285,23 @@ async def get_project_preview_asset(
 
     try:
         content = await storage.read(storage_path)
-        return Response(content=content, media_type=media_type)
     except StorageError as exc:
         logger.error("Failed to read asset from storage: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found"
         ) from exc
+
+    if not content.startswith(_GZIP_MAGIC):
+        return Response(content=content, media_type=media_type)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=content,
+            media_type=media_type,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=gzip.decompress(content),
+        media_type=media_type,
+        headers={"Vary": "Accept-Encoding"},
+    )
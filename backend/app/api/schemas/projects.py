@@ -60,9 +60,10 @@ class ProjectResponse(ProjectBase):
 
 class ProjectListResponse(BaseModel):
     items: list[ProjectResponse]
-    total: int
+    total: int | None = None
     page: int
     size: int
+    next_cursor: str | None = None
 
 
 class ProjectUploadResponse(BaseModel):
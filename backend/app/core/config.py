@@ -18,6 +18,16 @@ class Settings(BaseSettings):
     api_prefix: str = "/api/v1"
 
     database_url: str
+    database_pool_size: int = Field(
+        default=20,
+        description="Persistent connections kept in the SQLAlchemy pool per process",
+        ge=1,
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        description="Extra connections the pool may open under load",
+        ge=0,
+    )
 
     cors_origins: list[AnyHttpUrl] = Field(description="Allowed CORS origins")
     cors_allow_credentials: bool = True
@@ -54,6 +64,16 @@ class Settings(BaseSettings):
         description="Max seconds to wait for KiCad CLI operations before aborting",
         ge=1,
     )
+    kicad_cli_max_concurrency: int = Field(
+        default=4,
+        description="Max KiCad CLI processes allowed to run concurrently",
+        ge=1,
+    )
+    project_processing_max_concurrency: int = Field(
+        default=2,
+        description="Max project archives processed concurrently by background tasks",
+        ge=1,
+    )
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
@@ -11,13 +14,32 @@ from slowapi.middleware import SlowAPIMiddleware
 from app.api.router import api_router
 from app.core.config import settings
 from app.core.rate_limit import limiter
+from app.core.responses import ORJSONResponse
+from app.services.analytics import analytics_events
 from app.services.storage.factory import create_storage_service
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run background services for the lifetime of the application."""
+
+    analytics_events.start()
+    try:
+        yield
+    finally:
+        await analytics_events.stop()
+        await app.state.storage_service.close()
+
+
 def create_app() -> FastAPI:
     """Application factory for FastAPI instance."""
 
-    app = FastAPI(title=settings.app_name, debug=settings.debug)
+    app = FastAPI(
+        title=settings.app_name,
+        debug=settings.debug,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     app.add_middleware(SlowAPIMiddleware)
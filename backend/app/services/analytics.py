@@ -0,0 +1,181 @@
+"""Buffered recording of analytics events."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import UTC, date, datetime
+from typing import Any, Final
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import AnalyticsEvent, Project, uuid7
+from db.sessions import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_INTERVAL_SECONDS: Final = 0.5
+_MAX_BATCH_ROWS: Final = 1000
+# A failed batch stays queued and is retried with exponential backoff before it is dropped.
+_MAX_INSERT_ATTEMPTS: Final = 8
+# Events beyond this many queued are dropped, so an unreachable database cannot exhaust memory.
+_MAX_PENDING_EVENTS: Final = 50_000
+_PARTITION_LOCK_KEY: Final = "analytics_partitions"
+
+# Months whose analytics partition is known to exist in this process.
+_known_partitions: set[date] = set()
+
+# A batch stays queued until an insert is known to have succeeded, so one whose commit
+# landed but whose acknowledgement was lost (e.g. a dropped connection) is retried. Ids
+# are assigned when an event is recorded, so that second write skips the existing rows.
+_INSERT_EVENTS = pg_insert(AnalyticsEvent).on_conflict_do_nothing(
+    index_elements=[AnalyticsEvent.id, AnalyticsEvent.event_timestamp]
+)
+
+
+class AnalyticsEventBuffer:
+    """Collect analytics events in memory and write them in multi-row batches.
+
+    Request handlers only append to an in-process queue; a background task
+    flushes it periodically, so page views do not pay for an INSERT each.
+    A batch leaves the queue only once it is written (or has failed
+    `_MAX_INSERT_ATTEMPTS` times). Events still queued when the process dies,
+    or recorded while the queue is full, are lost, which is acceptable for
+    analytics.
+    """
+
+    def __init__(self, flush_interval: float = _FLUSH_INTERVAL_SECONDS) -> None:
+        self._flush_interval = flush_interval
+        self._pending: list[dict[str, Any]] = []
+        self._failed_attempts = 0
+        self._flush_lock = asyncio.Lock()
+        self._stopping: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def record(self, project_id: UUID, event_type: str, user_id: UUID | None = None) -> None:
+        """Queue an event for the next flush, dropping it if the queue is full."""
+        if len(self._pending) >= _MAX_PENDING_EVENTS:
+            logger.warning("Analytics queue full; dropping %s event", event_type)
+            return
+        self._pending.append(
+            {
+                "id": uuid7(),
+                "project_id": project_id,
+                "event_type": event_type,
+                "event_timestamp": datetime.now(UTC),
+                "user_id": user_id,
+            }
+        )
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running event loop."""
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self._run(self._stopping))
+
+    async def stop(self) -> None:
+        """Stop the flush task and write out whatever is still queued.
+
+        The task is signalled rather than cancelled, so an insert in progress
+        finishes before the final flush.
+        """
+        if self._task is not None and self._stopping is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+        self._failed_attempts = 0
+        await self.flush()
+        if self._pending:
+            logger.error("Dropped %d analytics events at shutdown", len(self._pending))
+            self._pending.clear()
+
+    async def flush(self) -> None:
+        """Write queued events to the database, stopping at the first failed batch."""
+        async with self._flush_lock:
+            while self._pending:
+                # Records only ever append, so the head of the queue is stable while awaiting.
+                batch = self._pending[:_MAX_BATCH_ROWS]
+                try:
+                    await _insert_events(batch)
+                except Exception:
+                    self._failed_attempts += 1
+                    if self._failed_attempts < _MAX_INSERT_ATTEMPTS:
+                        logger.warning(
+                            "Failed to write %d analytics events (attempt %d of %d)",
+                            len(batch),
+                            self._failed_attempts,
+                            _MAX_INSERT_ATTEMPTS,
+                            exc_info=True,
+                        )
+                        return
+                    logger.exception(
+                        "Dropped %d analytics events after %d attempts",
+                        len(batch),
+                        self._failed_attempts,
+                    )
+                self._failed_attempts = 0
+                del self._pending[: len(batch)]
+
+    async def _run(self, stopping: asyncio.Event) -> None:
+        while not stopping.is_set():
+            # Back off while the database keeps rejecting the head batch.
+            delay = self._flush_interval * 2**self._failed_attempts
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stopping.wait(), timeout=delay)
+            await self.flush()
+
+
+async def _ensure_partitions(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+    """Create the monthly analytics partitions the rows route to, if missing."""
+    months = {_month_start(row["event_timestamp"]) for row in rows} - _known_partitions
+    if not months:
+        return
+
+    # Serialise creators across workers so concurrent CREATE TABLE IF NOT EXISTS cannot race.
+    await session.execute(select(func.pg_advisory_xact_lock(func.hashtext(_PARTITION_LOCK_KEY))))
+    for month in sorted(months):
+        upper = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS analytics_{month:%Y_%m} PARTITION OF analytics "
+                f"FOR VALUES FROM ('{month} 00:00:00+00') TO ('{upper} 00:00:00+00')"
+            )
+        )
+    await session.commit()
+    _known_partitions.update(months)
+
+
+def _month_start(timestamp: datetime) -> date:
+    return timestamp.astimezone(UTC).date().replace(day=1)
+
+
+async def _insert_events(rows: list[dict[str, Any]]) -> None:
+    async with async_session_factory() as session:
+        await _ensure_partitions(session, rows)
+        try:
+            await session.execute(_INSERT_EVENTS, rows)
+            await session.commit()
+            return
+        except IntegrityError:
+            await session.rollback()
+
+        # A project deleted since its events were queued fails the whole batch;
+        # retry with only the events whose project still exists.
+        project_ids = {row["project_id"] for row in rows}
+        result = await session.execute(select(Project.id).where(Project.id.in_(project_ids)))
+        existing = set(result.scalars())
+        rows = [row for row in rows if row["project_id"] in existing]
+        if rows:
+            await session.execute(_INSERT_EVENTS, rows)
+            await session.commit()
+
+
+analytics_events = AnalyticsEventBuffer()
+
+
+__all__ = ["AnalyticsEventBuffer", "analytics_events"]
@@ -7,8 +7,9 @@ from typing import Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import Select, select
+from sqlalchemy import delete, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.orm import selectinload
 
 from app.api.schemas.comment_threads import (
@@ -33,11 +34,14 @@ async def list_threads(
     """List threads for a project."""
     await ensure_project_exists(session, project_id)
 
-    query: Select[tuple[CommentThread]] = (
-        select(CommentThread)
-        .where(CommentThread.project_id == project_id)
-        .options(selectinload(CommentThread.comments).selectinload(ThreadComment.author))
-        .order_by(CommentThread.created_at.asc())
+    # lambda_stmt caches the constructed statement too; project_id becomes a bound parameter.
+    query: StatementLambdaElement = lambda_stmt(
+        lambda: (
+            select(CommentThread)
+            .where(CommentThread.project_id == project_id)
+            .options(selectinload(CommentThread.comments).selectinload(ThreadComment.author))
+            .order_by(CommentThread.created_at.asc())
+        )
     )
 
     result = await session.execute(query)
@@ -194,7 +198,6 @@ async def update_thread_resolution(
         thread.resolved_at = None
 
     await session.commit()
-    await session.refresh(thread)
 
     if (
         payload.is_resolved
@@ -233,7 +236,12 @@ async def delete_thread(
             detail="Only project owner can delete threads",
         )
 
-    await session.delete(thread)
+    # Comments and notifications go with the thread via ON DELETE CASCADE.
+    await session.execute(
+        delete(CommentThread)
+        .where(CommentThread.id == thread.id)
+        .execution_options(synchronize_session=False)
+    )
     await session.commit()
 
 
@@ -268,10 +276,12 @@ async def _get_thread(
     project_id: UUID,
     thread_id: UUID,
 ) -> CommentThread:
-    query = (
-        select(CommentThread)
-        .options(selectinload(CommentThread.comments).selectinload(ThreadComment.author))
-        .where(CommentThread.project_id == project_id, CommentThread.id == thread_id)
+    query = lambda_stmt(
+        lambda: (
+            select(CommentThread)
+            .options(selectinload(CommentThread.comments).selectinload(ThreadComment.author))
+            .where(CommentThread.project_id == project_id, CommentThread.id == thread_id)
+        )
     )
     result = await session.execute(query)
     thread = result.scalar_one_or_none()
@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
 import io
-import json
 import logging
 import os
-import shutil
-import subprocess
+import posixpath
+import re
 import tempfile
+import threading
+import time
 import zipfile
+from collections.abc import Awaitable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Final, TypeVar
 from uuid import UUID
 
+import orjson
 from fastapi import (
     HTTPException,
     status,
@@ -27,18 +36,89 @@ from app.services.utils import slugify, unique_filename
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Limits how many kicad-cli processes this worker runs at once across all archives.
+_cli_slots = asyncio.Semaphore(settings.kicad_cli_max_concurrency)
+
+
 _PREVIEW_DIR_NAME: Final = "previews"
 _SCHEMATIC_DIR: Final = "schematics"
 _LAYOUT_DIR: Final = "layouts"
 _MODEL_DIR: Final = "models"
 _PHOTOS_DIR: Final = "photos"
 _INDEX_FILENAME: Final = "index.json"
+# Cached renders are keyed by archive content. A project's index records the entry it was built
+# from, and deleting the project evicts it (see `release_render_cache`).
+_RENDER_CACHE_ROOT: Final = "render-cache"
+_RENDER_CACHE_INDEX_KEY: Final = "render_cache_key"
+# Bump when render commands or index layout change so stale cached renders are ignored.
+_RENDER_CACHE_VERSION: Final = "1"
 _SAFE_ASSET_SUFFIXES: Final = {".svg", ".glb", ".png", ".jpg", ".jpeg", ".webp"}
+# Relative asset paths whose segments never start with a dot, which rules out absolute paths,
+# ``.``/``..`` traversal and hidden files in a single match.
+_ASSET_PATH_RE: Final = re.compile(
+    r"(?:[\w-][\w.-]*/)*[\w-][\w.-]*\.(?:"
+    + "|".join(sorted(suffix[1:] for suffix in _SAFE_ASSET_SUFFIXES))
+    + r")",
+    re.IGNORECASE,
+)
 _SAFE_SOURCE_SUFFIXES: Final = {".kicad_sch", ".kicad_pcb", ".kicad_pro", ".kicad_prl"}
+# Only KiCad sources and the companion files kicad-cli may read are extracted from archives.
+_EXTRACT_SUFFIXES: Final = _SAFE_SOURCE_SUFFIXES | {
+    ".kicad_sym",
+    ".kicad_mod",
+    ".kicad_dru",
+    ".kicad_wks",
+    ".step",
+    ".stp",
+    ".wrl",
+    ".wrz",
+}
+_EXTRACT_FILENAMES: Final = {"sym-lib-table", "fp-lib-table"}
+# KiCad autosaves and backup folders hold stale copies that would be mistaken for real sources.
+_AUTOSAVE_PREFIX: Final = "_autosave-"
+_BACKUP_DIR_SUFFIX: Final = "-backups"
 MAX_KICAD_ARCHIVE_SIZE_MB: Final = 30
 MAX_KICAD_ARCHIVE_SIZE_BYTES: Final = MAX_KICAD_ARCHIVE_SIZE_MB * 1024 * 1024
 MAX_IMAGE_PREVIEW_SIZE_MB: Final = 15
 MAX_IMAGE_PREVIEW_SIZE_BYTES: Final = MAX_IMAGE_PREVIEW_SIZE_MB * 1024 * 1024
+# Members above the size floor whose compression ratio looks like a zip bomb are skipped.
+_MAX_MEMBER_COMPRESSION_RATIO: Final = 100
+_COMPRESSION_RATIO_MIN_SIZE_BYTES: Final = 1024 * 1024
+_EXTRACT_CHUNK_BYTES: Final = 1024 * 1024
+_MAX_EXTRACT_WORKERS: Final = min(8, os.cpu_count() or 1)
+_MAX_INNER_COPPER_LAYERS: Final = 6
+# Matches layer table entries such as ``(4 "In1.Cu" signal)`` in a ``.kicad_pcb`` file.
+# KiCad 5 boards leave the layer name unquoted, e.g. ``(1 In1.Cu signal)``.
+_COPPER_LAYER_RE: Final = re.compile(
+    rb'\(\s*\d+\s+"?In(\d+)\.Cu"?\s+(?:signal|power|mixed|jumper)\b'
+)
+_FRONT_COPPER_RE: Final = re.compile(rb'\(\s*\d+\s+"?F\.Cu"?\s')
+# The layer table sits in the board header; give up if it has not started within this many bytes.
+_PCB_LAYER_TABLE_START: Final = b"(layers"
+_PCB_LAYER_TABLE_SCAN_LIMIT_BYTES: Final = 1024 * 1024
+_PCB_SCAN_CHUNK_BYTES: Final = 64 * 1024
+_SEXPR_TOKEN_RE: Final = re.compile(rb'[()"\\]')
+_SVG_SNIFF_BYTES: Final = 4096
+_INNER_LAYER_COMMON_LAYERS: Final = ("Edge.Cuts", "User.Drawings")
+# KiCad opens style ``<g>`` groups even for empty plots, so only shape elements count as content.
+# Inner-layer plots also carry the common layers' shapes, so those are counted separately as a
+# baseline that an inner layer must exceed to count as plotted.
+_SVG_DRAWING_MARKERS: Final = (b"<path", b"<rect", b"<polyline", b"<polygon", b"<circle")
+_MAX_CONCURRENT_UPLOADS: Final = 16
+_CLI_STDERR_TAIL_CHARS: Final = 500
+# Text assets are stored gzip-compressed; the asset route serves them with Content-Encoding.
+_GZIP_ASSET_SUFFIXES: Final = {".svg"}
+_GZIP_COMPRESS_LEVEL: Final = 6
+_INDEX_CACHE_TTL_SECONDS: Final = 60.0
+_INDEX_CACHE_MAX_ENTRIES: Final = 1024
+# JSON documents larger than this are decoded in a worker thread to keep the event loop free.
+_JSON_THREAD_THRESHOLD_BYTES: Final = 64 * 1024
+
+# project_id -> (expires_at, index, digest of the stored JSON). Entries are shared between callers
+# and must not be mutated.
+_index_cache: dict[UUID, tuple[float, dict[str, Any], bytes]] = {}
 
 
 async def process_project_archive(
@@ -61,12 +141,24 @@ async def process_project_archive(
 
         try:
             extraction_root.mkdir(parents=True, exist_ok=True)
-            with zipfile.ZipFile(archive_path) as zip_file:
-                _safe_extract(zip_file, extraction_root)
-        except (zipfile.BadZipFile, OSError):
+            await asyncio.to_thread(_safe_extract, archive_path, extraction_root)
+        except (zipfile.BadZipFile, OSError, ValueError):
             logger.exception("Failed to extract KiCad archive for project %s", project_id)
             return
 
+        # Filesystem walks, parsing and SVG composition run in worker threads so a large archive
+        # never stalls the event loop that also serves API requests.
+        source_files, schematic_sources, board_file, project_file = await asyncio.to_thread(
+            _scan_sources, extraction_root
+        )
+
+        # Identical archive contents always render to identical previews, so reuse them.
+        cache_key = await asyncio.to_thread(_render_cache_key, extraction_root, source_files)
+        if await _restore_cached_render(storage, project_id, cache_key):
+            logger.info("Reused cached previews for project %s", project_id)
+            return
+
+        # Render helpers write straight into these; they do not create them.
         for directory in (
             previews_root,
             schematics_root,
@@ -77,116 +169,310 @@ async def process_project_archive(
             directory.mkdir(parents=True, exist_ok=True)
 
         index: dict[str, Any] = {
-            "project": _read_project_metadata(extraction_root),
+            "project": await asyncio.to_thread(
+                _read_project_metadata, extraction_root, project_file
+            ),
             "schematics": [],
             "layouts": [],
             "models": [],
             "photos": [],
         }
 
-        schematic_sources = _find_all_schematics(extraction_root)
-        board_file = _find_first(extraction_root, "*.kicad_pcb")
-
+        # KiCad CLI runs are independent of each other, so they are launched concurrently.
+        # Each render reports its result and whether it completed without any failed step.
+        renders: dict[str, Coroutine[Any, Any, tuple[Any, bool]]] = {}
         if not schematic_sources:
             logger.warning("No schematic file found for project %s", project_id)
         else:
-            try:
-                index["schematics"] = _render_schematic_bundle(
+            renders["schematics"] = _render_or_log(
+                _render_schematic_bundle(
                     schematic_sources[0],
                     schematics_root,
                     schematic_sources,
                     extraction_root,
-                )
-            except Exception:
-                logger.exception("Schematic rendering failed for project %s", project_id)
+                ),
+                "Schematic rendering failed for project %s",
+                project_id,
+            )
 
         if board_file is None:
             logger.warning("No PCB file found for project %s", project_id)
         else:
-            try:
-                layout_entries = _render_board_svgs(board_file, layouts_root)
-                if layout_entries:
-                    index["layouts"].extend(layout_entries)
-            except Exception:
-                logger.exception("Board SVG rendering failed for project %s", project_id)
+            renders["layouts"] = _render_or_log(
+                _render_board_svgs(board_file, layouts_root),
+                "Board SVG rendering failed for project %s",
+                project_id,
+            )
+            renders["models"] = _render_or_log(
+                _render_board_glb(board_file, models_root),
+                "Board GLB rendering failed for project %s",
+                project_id,
+            )
+            renders["photos"] = _render_or_log(
+                _render_board_3d_render(board_file, photos_root),
+                "Board 3D render failed for project %s",
+                project_id,
+            )
 
-            try:
-                model_entry = _render_board_glb(board_file, models_root)
-                if model_entry:
-                    index["models"].append(model_entry)
-            except Exception:
-                logger.exception("Board GLB rendering failed for project %s", project_id)
+        # Storage paths are always "/"-separated, so join them as plain strings.
+        base_storage_prefix = _project_preview_base(project_id)
+        cache_prefix = posixpath.join(_RENDER_CACHE_ROOT, cache_key)
+        output_dirs = {
+            "schematics": schematics_root,
+            "layouts": layouts_root,
+            "models": models_root,
+            "photos": photos_root,
+        }
+        upload_slots = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
 
-            try:
-                render_entry = _render_board_3d_render(board_file, photos_root)
-                if render_entry:
-                    index["photos"].append(render_entry)
-            except Exception:
-                logger.exception("Board 3D render failed for project %s", project_id)
-
-        base_storage_path = _project_preview_base(project_id)
-
-        for root, _, files in os.walk(previews_root):
-            for file in files:
-                file_path = Path(root) / file
-                relative_path = file_path.relative_to(previews_root)
-                target_path = str(base_storage_path / relative_path)
+        async def upload_asset(target_path: str, file_path: Path) -> bool:
+            async with upload_slots:
                 try:
-                    await storage.upload(target_path, file_path)
-                except StorageError:
+                    if file_path.suffix in _GZIP_ASSET_SUFFIXES:
+                        content = await asyncio.to_thread(_gzip_file, file_path)
+                        await storage.save(target_path, content)
+                    else:
+                        await storage.upload(target_path, file_path)
+                except (OSError, StorageError):
                     logger.exception("Failed to upload preview asset: %s", target_path)
+                    return False
+                return True
+
+        async def cache_asset(relative_path: str) -> bool:
+            async with upload_slots:
+                try:
+                    await storage.copy(
+                        posixpath.join(base_storage_prefix, relative_path),
+                        posixpath.join(cache_prefix, relative_path),
+                    )
+                except StorageError:
+                    logger.exception("Failed to cache preview asset: %s", relative_path)
+                    return False
+                return True
+
+        async def render_and_upload(
+            key: str, render: Awaitable[tuple[Any, bool]]
+        ) -> tuple[Any, list[tuple[str, Path]], bool]:
+            # Each render owns its output directory, so its files can be uploaded as soon as it
+            # finishes while slower KiCad CLI runs are still going.
+            result, complete = await render
+            generated = [
+                (file_path.relative_to(previews_root).as_posix(), file_path)
+                for file_path in output_dirs[key].rglob("*")
+                if file_path.is_file()
+            ]
+            uploaded = await asyncio.gather(
+                *(
+                    upload_asset(posixpath.join(base_storage_prefix, relative_path), file_path)
+                    for relative_path, file_path in generated
+                )
+            )
+            return result, generated, complete and all(uploaded)
 
+        outcomes = await asyncio.gather(
+            *(render_and_upload(key, render) for key, render in renders.items())
+        )
+
+        generated: list[tuple[str, Path]] = []
+        # Only fully successful renders are cached so transient failures are retried next time.
+        cacheable = True
+        for key, (result, files, complete) in zip(renders, outcomes, strict=True):
+            if isinstance(result, list):
+                index[key].extend(result)
+            elif result:
+                index[key].append(result)
+            generated.extend(files)
+            cacheable = cacheable and complete
+
+        if cacheable:
+            index[_RENDER_CACHE_INDEX_KEY] = cache_key
         await _write_index(storage, project_id, index)
 
+        if cacheable:
+            cached = await asyncio.gather(
+                *(cache_asset(relative_path) for relative_path, _ in generated)
+            )
+            if all(cached):
+                await _save_render_cache_manifest(
+                    storage, cache_key, index, [relative_path for relative_path, _ in generated]
+                )
+
+
+async def _render_or_log(
+    render: Awaitable[tuple[_T | None, bool]], message: str, project_id: UUID
+) -> tuple[_T | None, bool]:
+    """Await a render step, logging and swallowing failures so other renders can finish.
 
-def _safe_extract(zip_file: zipfile.ZipFile, destination: Path) -> None:
-    """Extract zip contents ensuring paths stay within destination."""
+    Returns the render result and whether it completed; a render that raised is incomplete.
+    """
+
+    try:
+        return await render
+    except Exception:
+        logger.exception(message, project_id)
+        return None, False
+
+
+def _safe_extract(archive_path: Path, destination: Path) -> None:
+    """Extract KiCad-relevant zip members ensuring paths stay within destination.
+
+    The declared uncompressed size of the selected members is checked against
+    ``MAX_KICAD_ARCHIVE_SIZE_BYTES`` before anything is written to disk, and the bytes
+    actually inflated are counted against the same limit while streaming. Members are
+    inflated by a small thread pool, each worker reading through its own ``ZipFile``.
+    """
+
+    # Uploads are capped at MAX_KICAD_ARCHIVE_SIZE_BYTES, so the archive is normally read into
+    # memory once and shared by every reader below; anything larger is streamed from disk.
+    archive_bytes = (
+        archive_path.read_bytes()
+        if archive_path.stat().st_size <= MAX_KICAD_ARCHIVE_SIZE_BYTES
+        else None
+    )
+
+    @contextmanager
+    def open_archive() -> Iterator[zipfile.ZipFile]:
+        if archive_bytes is not None:
+            with zipfile.ZipFile(io.BytesIO(archive_bytes)) as zip_file:
+                yield zip_file
+            return
+        with (
+            archive_path.open("rb", buffering=_EXTRACT_CHUNK_BYTES) as archive_file,
+            zipfile.ZipFile(archive_file) as zip_file,
+        ):
+            yield zip_file
 
     dest_root = destination.resolve()
-    for member in zip_file.infolist():
+    members: list[tuple[zipfile.ZipInfo, Path]] = []
+    with open_archive() as zip_file:
+        infolist = zip_file.infolist()
+
+    skipped = 0
+    for member in infolist:
         filename = member.filename
-        if filename.startswith("__MACOSX/") or filename.endswith("/.DS_Store"):
+        if filename.startswith("__MACOSX/") or member.is_dir():
             continue
 
-        target_path = (dest_root / filename).resolve()
-        try:
-            target_path.relative_to(dest_root)
-            within_destination = True
-        except ValueError:
-            within_destination = False
+        directory, basename = posixpath.split(filename)
+        if (
+            member.file_size == 0
+            or basename.startswith(_AUTOSAVE_PREFIX)
+            or any(part.endswith(_BACKUP_DIR_SUFFIX) for part in directory.split("/"))
+            or (
+                posixpath.splitext(basename)[1].lower() not in _EXTRACT_SUFFIXES
+                and basename not in _EXTRACT_FILENAMES
+            )
+        ):
+            skipped += 1
+            continue
 
-        if not within_destination:
+        # Extraction only ever creates regular files and directories, so no symlink inside the
+        # destination can redirect a write; a lexical check is enough to keep members inside it.
+        normalized = posixpath.normpath(filename)
+        if posixpath.isabs(normalized) or normalized == ".." or normalized.startswith("../"):
             logger.warning("Skipping unsafe archive member outside root: %s", filename)
             continue
+        target_path = dest_root / normalized
 
-        zip_file.extract(member, dest_root)
-
-
-def _find_first(root: Path, pattern: str) -> Path | None:
-    """Return the first path matching the glob pattern under root."""
-
-    return next(root.rglob(pattern), None)
+        if (
+            member.file_size > _COMPRESSION_RATIO_MIN_SIZE_BYTES
+            and member.file_size / max(member.compress_size, 1) > _MAX_MEMBER_COMPRESSION_RATIO
+        ):
+            logger.warning(
+                "Skipping archive member with suspicious compression ratio: %s", filename
+            )
+            continue
 
+        members.append((member, target_path))
 
-def _find_all_schematics(root: Path) -> list[Path]:
-    """Return all schematic sources inside the extracted archive."""
+    if skipped:
+        logger.info("Skipped %d archive members not needed for rendering", skipped)
 
-    return sorted(root.rglob("*.kicad_sch"))
+    total_size = sum(member.file_size for member, _ in members)
+    if total_size > MAX_KICAD_ARCHIVE_SIZE_BYTES:
+        raise ValueError(
+            f"Archive expands to {total_size} bytes, "
+            f"exceeding the {MAX_KICAD_ARCHIVE_SIZE_MB} MB limit"
+        )
 
+    # Archives hold many files under a few directories, so each directory is created once up
+    # front; this also keeps the extraction workers from racing on mkdir.
+    for directory in {target_path.parent for _, target_path in members}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    extracted_bytes = 0
+    extracted_lock = threading.Lock()
+
+    def extract_members(batch: list[tuple[zipfile.ZipInfo, Path]]) -> None:
+        nonlocal extracted_bytes
+        # ZipFile handles are not safe to share between threads, so each worker opens its own.
+        with open_archive() as zip_file:
+            for member, target_path in batch:
+                with zip_file.open(member) as source, target_path.open("wb") as output:
+                    while chunk := source.read(_EXTRACT_CHUNK_BYTES):
+                        with extracted_lock:
+                            extracted_bytes += len(chunk)
+                            over_limit = extracted_bytes > MAX_KICAD_ARCHIVE_SIZE_BYTES
+                        if over_limit:
+                            raise ValueError(
+                                f"Archive expands beyond the {MAX_KICAD_ARCHIVE_SIZE_MB} MB limit"
+                            )
+                        output.write(chunk)
+
+    workers = min(_MAX_EXTRACT_WORKERS, len(members))
+    if workers <= 1:
+        extract_members(members)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        batches = [executor.submit(extract_members, members[i::workers]) for i in range(workers)]
+        for batch in batches:
+            batch.result()
+
+
+def _scan_sources(root: Path) -> tuple[list[Path], list[Path], Path | None, Path | None]:
+    """Walk the extracted archive once, returning its files and the KiCad sources within.
+
+    The result is ``(files, schematics, board, project_file)``. Directories are visited in
+    sorted order so the first board and project file found are stable across runs.
+    """
 
-def _render_schematic_bundle(
+    files: list[Path] = []
+    schematics: list[Path] = []
+    board: Path | None = None
+    project_file: Path | None = None
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        directory = Path(dirpath)
+        for filename in sorted(filenames):
+            file_path = directory / filename
+            files.append(file_path)
+            suffix = os.path.splitext(filename)[1].lower()
+            if suffix == ".kicad_sch":
+                schematics.append(file_path)
+            elif suffix == ".kicad_pcb" and board is None:
+                board = file_path
+            elif suffix == ".kicad_pro" and project_file is None:
+                project_file = file_path
+
+    schematics.sort()
+    return files, schematics, board, project_file
+
+
+async def _render_schematic_bundle(
     primary_source: Path,
     output_dir: Path,
     all_sources: list[Path],
     project_root: Path,
-) -> list[dict[str, Any]]:
-    """Render schematic sheets and return a single preview entry with page metadata."""
+) -> tuple[list[dict[str, Any]], bool]:
+    """Render schematic sheets and return a single preview entry with page metadata.
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    The flag is ``False`` when the multi-sheet grid could not be composed.
+    """
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with tempfile.TemporaryDirectory(dir=output_dir.parent) as tmp_dir:
         tmp_path = Path(tmp_dir)
-        _run_cli(
+        await _run_cli(
             [
                 settings.kicad_cli_path,
                 "sch",
@@ -204,18 +490,20 @@ def _render_schematic_bundle(
         if not exported:
             raise RuntimeError("No schematic SVG generated")
 
-        used_filenames: set[str] = set()
         pages: list[dict[str, Any]] = []
-        copied_svg_paths: list[Path] = []
+        # Each sheet is read once here; the title lookup and grid composition share the bytes.
+        sheet_contents: list[bytes] = []
         for idx, svg_file in enumerate(exported, start=1):
-            title = derive_sheet_title(svg_file)
+            content = svg_file.read_bytes()
+            title = derive_sheet_title(svg_file, content)
+            # The numeric page prefix keeps every slug distinct, so no collision check is needed.
             slug = slugify(f"{idx:02d}-{title}")
-            filename = unique_filename(slug, ".svg", used_filenames)
-            used_filenames.add(filename)
+            filename = f"{slug}.svg"
 
             destination = output_dir / filename
-            shutil.copyfile(svg_file, destination)
-            copied_svg_paths.append(destination)
+            # The staging dir sits beside output_dir, so this is always a same-filesystem rename.
+            os.replace(svg_file, destination)
+            sheet_contents.append(content)
 
             pages.append(
                 {
@@ -228,13 +516,16 @@ def _render_schematic_bundle(
             )
 
     composed_entry: dict[str, Any] | None = None
-    if len(copied_svg_paths) > 1:
-        composed_filename = unique_filename("schematic-grid", ".svg", used_filenames)
+    complete = True
+    if len(sheet_contents) > 1:
+        # Page slugs always start with digits, so the grid name cannot clash with them.
+        composed_filename = "schematic-grid.svg"
         composed_path = output_dir / composed_filename
         try:
-            compose_svg_grid(copied_svg_paths, composed_path)
+            await asyncio.to_thread(compose_svg_grid, sheet_contents, composed_path)
         except Exception:
             logger.exception("Failed to compose schematic grid; falling back to first sheet")
+            complete = False
         else:
             composed_entry = {
                 "id": f"{slugify(primary_source.stem) or 'schematics'}-grid",
@@ -264,13 +555,15 @@ def _render_schematic_bundle(
         "multi_page": len(pages) > 1,
     }
 
-    return [bundle]
+    return [bundle], complete
 
 
-def _render_board_svgs(source: Path, output_dir: Path) -> list[dict[str, Any]]:
-    """Render front and back PCB layout SVGs using KiCad CLI."""
+async def _render_board_svgs(source: Path, output_dir: Path) -> tuple[list[dict[str, Any]], bool]:
+    """Render front, back and inner copper PCB layout SVGs using KiCad CLI.
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    The flag is ``False`` when any layer export failed or timed out. Probing an inner layer the
+    board does not have is not a failure.
+    """
 
     layer_specs: list[tuple[str, str, list[str], list[str]]] = [
         (
@@ -287,24 +580,73 @@ def _render_board_svgs(source: Path, output_dir: Path) -> list[dict[str, Any]]:
         ),
     ]
 
-    # Add specs for inner layers (In1.Cu ... In6.Cu)
-    # We try to render them; if the output is empty/invalid, we skip adding them to the index.
-    for i in range(1, 7):
-        layer_name = f"In{i}.Cu"
-        layer_specs.append(
-            (
-                f"inner-{i}",
-                f"Inner Layer {i}",
-                [layer_name, "Edge.Cuts", "User.Drawings"],
-                [],
-            )
-        )
+    # Only request inner layers the board actually declares; probing missing layers costs a
+    # full KiCad CLI launch each. Fall back to probing In1.Cu ... In6.Cu if the table is unreadable.
+    declared_inner_layers = await asyncio.to_thread(_enumerate_inner_copper_layers, source)
+    if declared_inner_layers is None:
+        inner_layers = list(range(1, _MAX_INNER_COPPER_LAYERS + 1))
+    else:
+        inner_layers = declared_inner_layers[:_MAX_INNER_COPPER_LAYERS]
+
+    inner_specs = [
+        (f"inner-{i}", f"Inner Layer {i}", [f"In{i}.Cu", *_INNER_LAYER_COMMON_LAYERS], [])
+        for i in inner_layers
+    ]
+
+    outline_shapes: asyncio.Task[int | None] | None = None
 
-    entries: list[dict[str, Any]] = []
+    def inner_layer_baseline() -> asyncio.Task[int | None]:
+        # Shared by every inner layer rendered on its own, so the outline is plotted at most once.
+        nonlocal outline_shapes
+        if outline_shapes is None:
+            outline_shapes = asyncio.ensure_future(render_outline_shapes())
+        return outline_shapes
+
+    async def render_outline_shapes() -> int | None:
+        with tempfile.TemporaryDirectory(dir=output_dir.parent) as tmp_dir:
+            destination = Path(tmp_dir) / "outline.svg"
+            try:
+                await _run_cli(
+                    [
+                        settings.kicad_cli_path,
+                        "pcb",
+                        "export",
+                        "svg",
+                        "--output",
+                        str(destination),
+                        "--layers",
+                        ",".join(_INNER_LAYER_COMMON_LAYERS),
+                        "--exclude-drawing-sheet",
+                        "--page-size-mode",
+                        "2",
+                        "--mode-single",
+                        str(source),
+                    ]
+                )
+            except RuntimeError:
+                logger.warning("Failed to plot the board outline of %s", source, exc_info=True)
+                return None
+            return await asyncio.to_thread(_count_svg_shapes, destination)
 
-    for key, title, layers, extra_flags in layer_specs:
+    def layer_entry(key: str, title: str, layers: list[str]) -> dict[str, Any]:
         filename = f"{key}.svg"
-        destination = output_dir / filename
+        return {
+            "id": key,
+            "filename": filename,
+            "title": title,
+            "layers": layers,
+            "path": f"{_LAYOUT_DIR}/{filename}",
+        }
+
+    async def render_layer(
+        key: str,
+        title: str,
+        layers: list[str],
+        extra_flags: list[str],
+        probe: bool = False,
+        inner: bool = False,
+    ) -> tuple[dict[str, Any] | None, bool]:
+        destination = output_dir / f"{key}.svg"
 
         command = [
             settings.kicad_cli_path,
@@ -324,34 +666,197 @@ def _render_board_svgs(source: Path, output_dir: Path) -> list[dict[str, Any]]:
         command.append(str(source))
 
         try:
-            _run_cli(command)
+            await _run_cli(command)
+        except _CliTimeoutError:
+            logger.warning("Timed out rendering layer %s of %s", key, source)
+            return None, False
         except RuntimeError:
-            # Expected for missing inner layers
-            logger.debug("Failed to render or layer not present: %s", key)
-            continue
-
-        if destination.exists():
-            # Skip empty or invalid SVGs (approximate check by size)
-            if destination.stat().st_size < 500:
-                continue
+            # Expected when probing inner layers of a board whose layer table was unreadable.
+            if probe:
+                logger.debug("Layer not present: %s", key)
+                return None, True
+            logger.warning("Failed to render layer %s of %s", key, source, exc_info=True)
+            return None, False
+
+        baseline = await inner_layer_baseline() if inner else 0
+        if baseline is None:
+            # Without the outline's shape count an empty inner layer cannot be told apart.
+            return None, False
+        if not await asyncio.to_thread(_is_plotted_svg, destination, baseline):
+            return None, True
+
+        return layer_entry(key, title, layers), True
+
+    async def render_inner_layers() -> list[tuple[dict[str, Any] | None, bool]]:
+        # Declared inner layers are plotted by a single KiCad CLI launch, one SVG per layer.
+        with tempfile.TemporaryDirectory(dir=output_dir.parent) as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            try:
+                await _run_cli(
+                    [
+                        settings.kicad_cli_path,
+                        "pcb",
+                        "export",
+                        "svg",
+                        "--output",
+                        str(tmp_path),
+                        # Edge.Cuts plotted with the common layers is the outline-only baseline.
+                        "--layers",
+                        ",".join([*(f"In{i}.Cu" for i in inner_layers), "Edge.Cuts"]),
+                        "--common-layers",
+                        ",".join(_INNER_LAYER_COMMON_LAYERS),
+                        "--exclude-drawing-sheet",
+                        "--page-size-mode",
+                        "2",
+                        "--mode-multi",
+                        str(source),
+                    ]
+                )
+            except RuntimeError:
+                logger.debug("Batched inner layer export failed; rendering layers one by one")
+                return list(
+                    await asyncio.gather(*(render_layer(*spec, inner=True) for spec in inner_specs))
+                )
 
-            entries.append(
-                {
-                    "id": key,
-                    "filename": filename,
-                    "title": title,
-                    "layers": layers,
-                    "path": f"{_LAYOUT_DIR}/{filename}",
-                }
+            outline = next(tmp_path.glob("*Edge_Cuts.svg"), None)
+            baseline = await asyncio.to_thread(_count_svg_shapes, outline) if outline else None
+            if baseline is None:
+                baseline = await inner_layer_baseline()
+            if baseline is None:
+                return [(None, False) for _ in inner_specs]
+
+            async def collect_layer(
+                i: int, spec: tuple[str, str, list[str], list[str]]
+            ) -> tuple[dict[str, Any] | None, bool]:
+                key, title, layers, _ = spec
+                # KiCad names multi-mode plots ``<board>-In1_Cu.svg``.
+                exported = next(tmp_path.glob(f"*In{i}_Cu.svg"), None)
+                if exported is None:
+                    logger.debug("No batched plot found for %s; rendering it alone", key)
+                    return await render_layer(*spec, inner=True)
+                if not await asyncio.to_thread(_is_plotted_svg, exported, baseline):
+                    return None, True
+                # The staging dir sits beside output_dir, so this is always a same-filesystem rename.
+                os.replace(exported, output_dir / f"{key}.svg")
+                return layer_entry(key, title, layers), True
+
+            return list(
+                await asyncio.gather(
+                    *(
+                        collect_layer(i, spec)
+                        for i, spec in zip(inner_layers, inner_specs, strict=True)
+                    )
+                )
             )
 
-    return entries
+    # Each layer is written to its own file, so the exports can run side by side.
+    renders: list[Awaitable[Any]] = [render_layer(*spec) for spec in layer_specs]
+    if declared_inner_layers is None:
+        renders.extend(render_layer(*spec, probe=True, inner=True) for spec in inner_specs)
+    elif inner_specs:
+        renders.append(render_inner_layers())
+
+    results: list[tuple[dict[str, Any] | None, bool]] = []
+    for result in await asyncio.gather(*renders):
+        if isinstance(result, list):
+            results.extend(result)
+        else:
+            results.append(result)
+    entries = [entry for entry, _ in results if entry is not None]
+    return entries, all(complete for _, complete in results)
+
 
+def _is_plotted_svg(path: Path, baseline: int = 0) -> bool:
+    """Return whether ``path`` is an SVG drawing more than ``baseline`` shapes.
 
-def _render_board_glb(source: Path, output_dir: Path) -> dict[str, Any] | None:
-    """Render a GLB preview if KiCad CLI succeeds."""
+    ``baseline`` is the shape count the plot's common layers contribute on their own.
+    """
+
+    shapes = _count_svg_shapes(path)
+    return shapes is not None and shapes > baseline
+
+
+def _count_svg_shapes(path: Path) -> int | None:
+    """Return the number of shape elements in an SVG, or ``None`` if it is missing or not SVG."""
+
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    if b"<svg" not in data[:_SVG_SNIFF_BYTES]:
+        return None
+    return sum(data.count(marker) for marker in _SVG_DRAWING_MARKERS)
+
+
+def _enumerate_inner_copper_layers(source: Path) -> list[int] | None:
+    """Return the inner copper layer numbers declared in a board's layer table.
+
+    Returns ``None`` when the board file cannot be read or has no recognisable layer table.
+    """
+
+    table = _read_pcb_layer_table(source)
+    if table is None or not _FRONT_COPPER_RE.search(table):
+        return None
+
+    return sorted({int(match.group(1)) for match in _COPPER_LAYER_RE.finditer(table)})
+
+
+def _read_pcb_layer_table(source: Path) -> bytes | None:
+    """Return the board's ``(layers ...)`` block, reading only up to its closing paren."""
+
+    overlap = len(_PCB_LAYER_TABLE_START) - 1
+    pending = b""
+    table = bytearray()
+    depth = 0
+    in_string = False
+    escaped_position = -1
+    scanned = 0
+    try:
+        with source.open("rb") as handle:
+            while chunk := handle.read(_PCB_SCAN_CHUNK_BYTES):
+                scanned += len(chunk)
+                if not table:
+                    # Only the new chunk plus a marker-sized tail of the previous one is searched.
+                    window = pending + chunk
+                    start = window.find(_PCB_LAYER_TABLE_START)
+                    if start < 0:
+                        if scanned >= _PCB_LAYER_TABLE_SCAN_LIMIT_BYTES:
+                            return None
+                        pending = window[-overlap:]
+                        continue
+                    chunk = window[start:]
+
+                base = len(table)
+                for token in _SEXPR_TOKEN_RE.finditer(chunk):
+                    char = token.group()
+                    position = base + token.start()
+                    if in_string:
+                        if position == escaped_position:
+                            continue
+                        if char == b"\\":
+                            escaped_position = position + 1
+                        elif char == b'"':
+                            in_string = False
+                    elif char == b'"':
+                        in_string = True
+                    elif char == b"(":
+                        depth += 1
+                    elif char == b")":
+                        depth -= 1
+                        if depth == 0:
+                            table += chunk[: token.end()]
+                            return bytes(table)
+                table += chunk
+    except OSError:
+        logger.debug("Unable to read layer table from %s", source)
+
+    return None
+
+
+async def _render_board_glb(source: Path, output_dir: Path) -> tuple[dict[str, Any] | None, bool]:
+    """Render a GLB preview if KiCad CLI succeeds; complete only if the model was written."""
 
-    output_dir.mkdir(parents=True, exist_ok=True)
     destination = output_dir / "board.glb"
 
     command = [
@@ -370,19 +875,22 @@ def _render_board_glb(source: Path, output_dir: Path) -> dict[str, Any] | None:
         str(source),
     ]
 
-    _run_cli(command)
+    await _run_cli(command)
 
     if destination.exists():
-        return {
+        entry = {
             "id": "board-3d",
             "filename": destination.name,
             "title": "3D model",
             "path": f"{_MODEL_DIR}/{destination.name}",
         }
-    return None
+        return entry, True
+    return None, False
 
 
-def _render_board_3d_render(source: Path, output_dir: Path) -> dict[str, Any] | None:
+async def _render_board_3d_render(
+    source: Path, output_dir: Path
+) -> tuple[dict[str, Any] | None, bool]:
     """Render a static PNG of the 3D board for thumbnails.
 
     This uses ``kicad-cli pcb render`` to generate a raytraced image of the
@@ -390,7 +898,6 @@ def _render_board_3d_render(source: Path, output_dir: Path) -> dict[str, Any] |
     back to other preview assets.
     """
 
-    output_dir.mkdir(parents=True, exist_ok=True)
     destination = output_dir / "board-3d.png"
 
     command = [
@@ -402,58 +909,196 @@ def _render_board_3d_render(source: Path, output_dir: Path) -> dict[str, Any] |
         str(source),
     ]
 
-    _run_cli(command)
+    await _run_cli(command)
 
     if destination.exists():
-        return {
+        entry = {
             "id": "board-3d-render",
             "filename": destination.name,
             "title": "3D render",
             "path": f"{_PHOTOS_DIR}/{destination.name}",
         }
-    return None
+        return entry, True
+    return None, False
+
+
+class _CliTimeoutError(RuntimeError):
+    """Raised when a kicad-cli run exceeds ``settings.kicad_cli_timeout_seconds``."""
+
 
+async def _run_cli(command: list[str]) -> None:
+    """Execute KiCad CLI command with configured timeout.
 
-def _run_cli(command: list[str]) -> None:
-    """Execute KiCad CLI command with configured timeout."""
+    Concurrent invocations are capped by ``settings.kicad_cli_max_concurrency``.
+    """
+
+    logger.debug("Running KiCad CLI command: %r", command)
+    async with _cli_slots:
+        try:
+            # Progress output is discarded; stderr is kept so failures can say what went wrong.
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:  # pragma: no cover
+            raise RuntimeError("kicad-cli executable not found") from exc
+
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=settings.kicad_cli_timeout_seconds
+            )
+        except TimeoutError as exc:
+            raise _CliTimeoutError("kicad-cli command timed out") from exc
+        finally:
+            # Timed out or cancelled mid-run: reap kicad-cli instead of orphaning it.
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    if process.returncode != 0:
+        detail = stderr.decode(errors="replace").strip()[-_CLI_STDERR_TAIL_CHARS:]
+        raise RuntimeError(f"kicad-cli exited with code {process.returncode}: {detail}")
+
+
+async def _write_index(storage: StorageService, project_id: UUID, index: dict[str, Any]) -> bool:
+    """Persist the preview index JSON file and refresh the in-process cache with it.
+
+    Returns whether the index is now stored; failures are logged rather than raised.
+
+    The write is skipped when the content hash matches the one cached for what this process last
+    read or wrote, so an unchanged index costs neither a read nor a write.
+    """
+
+    index_storage_path = _preview_index_storage_path(project_id)
+    content = await asyncio.to_thread(orjson.dumps, index)
+    digest = _index_digest(content)
+    entry = _index_cache.get(project_id)
+    if entry is not None and entry[0] >= time.monotonic() and entry[2] == digest:
+        return True
 
-    logger.debug("Running KiCad CLI command: %s", " ".join(command))
     try:
-        subprocess.run(  # noqa: PL subprocess security: controlled values
-            command,
-            check=True,
-            timeout=settings.kicad_cli_timeout_seconds,
+        await storage.save(index_storage_path, content)
+    except StorageError:
+        _index_cache.pop(project_id, None)
+        logger.exception("Failed to write preview index for project %s", project_id)
+        return False
+    _set_cached_index(project_id, index, digest)
+    return True
+
+
+def _index_digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _gzip_file(file_path: Path) -> bytes:
+    """Return the gzip-compressed contents of a file, with a fixed mtime for stable output."""
+
+    return gzip.compress(file_path.read_bytes(), compresslevel=_GZIP_COMPRESS_LEVEL, mtime=0)
+
+
+def _render_cache_key(extraction_root: Path, files: list[Path]) -> str:
+    """Return a content hash of the extracted archive used to key cached renders."""
+
+    digest = hashlib.blake2b(_RENDER_CACHE_VERSION.encode(), digest_size=20)
+    for file_path in sorted(files):
+        relative_path = file_path.relative_to(extraction_root).as_posix()
+        digest.update(f"{relative_path}\0{file_path.stat().st_size}\0".encode())
+        with file_path.open("rb") as handle:
+            while chunk := handle.read(_EXTRACT_CHUNK_BYTES):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def _restore_cached_render(storage: StorageService, project_id: UUID, cache_key: str) -> bool:
+    """Copy previously rendered previews for ``cache_key`` into the project, if cached."""
+
+    cache_prefix = posixpath.join(_RENDER_CACHE_ROOT, cache_key)
+    try:
+        manifest = await _decode_json(
+            await storage.read(posixpath.join(cache_prefix, _INDEX_FILENAME))
+        )
+    except (StorageError, orjson.JSONDecodeError):
+        return False
+
+    base_storage_prefix = _project_preview_base(project_id)
+    try:
+        await asyncio.gather(
+            *(
+                storage.copy(
+                    posixpath.join(cache_prefix, relative_path),
+                    posixpath.join(base_storage_prefix, relative_path),
+                )
+                for relative_path in manifest["files"]
+            )
         )
-    except FileNotFoundError as exc:  # pragma: no cover
-        raise RuntimeError("kicad-cli executable not found") from exc
-    except subprocess.TimeoutExpired as exc:
-        raise RuntimeError("kicad-cli command timed out") from exc
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(f"kicad-cli exited with code {exc.returncode}") from exc
+    except StorageError:
+        logger.warning("Cached previews %s are incomplete; rendering again", cache_key)
+        return False
 
+    # Without an index the copied assets are invisible, so render again instead.
+    return await _write_index(
+        storage, project_id, {**manifest["index"], _RENDER_CACHE_INDEX_KEY: cache_key}
+    )
 
-async def _write_index(storage: StorageService, project_id: UUID, index: dict[str, Any]) -> None:
-    """Persist the preview index JSON file."""
+
+async def release_render_cache(storage: StorageService, project_id: UUID) -> None:
+    """Evict the render cache entry a project's previews were built from, if any.
+
+    Called when the project is deleted. Other projects built from the same archive hold their
+    own copies of the assets, so evicting a shared entry only costs a later identical upload a
+    fresh render.
+    """
 
     try:
-        content = json.dumps(index, indent=2, ensure_ascii=False).encode("utf-8")
-        file_obj = io.BytesIO(content)
-        await storage.save(_preview_index_storage_path(project_id), file_obj)
+        index = await _decode_json(await storage.read(_preview_index_storage_path(project_id)))
+    except (StorageError, orjson.JSONDecodeError):
+        return
+    cache_key = index.get(_RENDER_CACHE_INDEX_KEY)
+    if not isinstance(cache_key, str):
+        return
+
+    cache_prefix = posixpath.join(_RENDER_CACHE_ROOT, cache_key)
+    manifest_path = posixpath.join(cache_prefix, _INDEX_FILENAME)
+    try:
+        manifest = await _decode_json(await storage.read(manifest_path))
+    except (StorageError, orjson.JSONDecodeError):
+        return
+
+    try:
+        # The manifest goes first, so a concurrent restore misses rather than copying a
+        # half-deleted entry.
+        await storage.delete(manifest_path)
+        await storage.delete_many(
+            [posixpath.join(cache_prefix, relative_path) for relative_path in manifest["files"]]
+        )
     except StorageError:
-        logger.exception("Failed to write preview index for project %s", project_id)
+        logger.warning("Failed to evict render cache entry %s", cache_key, exc_info=True)
 
 
-def _read_project_metadata(extraction_root: Path) -> dict[str, Any]:
+async def _save_render_cache_manifest(
+    storage: StorageService, cache_key: str, index: dict[str, Any], files: list[str]
+) -> None:
+    """Record a completed render in the cache; written last so it marks a complete entry."""
+
+    manifest_path = posixpath.join(_RENDER_CACHE_ROOT, cache_key, _INDEX_FILENAME)
+    try:
+        content = await asyncio.to_thread(orjson.dumps, {"index": index, "files": files})
+        await storage.save(manifest_path, content)
+    except StorageError:
+        logger.exception("Failed to write render cache manifest %s", manifest_path)
+
+
+def _read_project_metadata(extraction_root: Path, project_file: Path | None) -> dict[str, Any]:
     """Extract basic project metadata from the KiCad project file if present."""
 
-    project_file = _find_first(extraction_root, "*.kicad_pro")
     if not project_file:
         return {}
 
     try:
-        content = project_file.read_text(encoding="utf-8")
-        data = json.loads(content)
-    except (OSError, json.JSONDecodeError):
+        data = orjson.loads(project_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
         logger.debug("Unable to parse project metadata from %s", project_file)
         return {}
 
@@ -480,14 +1125,23 @@ def _read_project_metadata(extraction_root: Path) -> dict[str, Any]:
 
 
 async def load_preview_index(storage: StorageService, project_id: UUID) -> dict[str, Any]:
-    """Load the stored preview index for a project."""
+    """Load the stored preview index for a project.
+
+    Successfully parsed indexes are cached in-process for a short TTL; the returned dict is
+    shared with other callers and must be treated as read-only.
+    """
+
+    cached = _get_cached_index(project_id)
+    if cached is not None:
+        return cached
 
     index_storage_path = _preview_index_storage_path(project_id)
     try:
-        content_bytes = await storage.read(index_storage_path)
-        content = content_bytes.decode("utf-8")
-        return json.loads(content)
-    except (StorageError, json.JSONDecodeError):
+        content = await storage.read(index_storage_path)
+        index = await _decode_json(content)
+        _set_cached_index(project_id, index, _index_digest(content))
+        return index
+    except (StorageError, orjson.JSONDecodeError):
         logger.exception("Failed to read preview index for project %s", project_id)
         return {
             "project": {},
@@ -498,6 +1152,33 @@ async def load_preview_index(storage: StorageService, project_id: UUID) -> dict[
         }
 
 
+async def _decode_json(content: bytes) -> Any:
+    """Parse JSON bytes, offloading large documents to a worker thread."""
+
+    if len(content) > _JSON_THREAD_THRESHOLD_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
+
+
+def _get_cached_index(project_id: UUID) -> dict[str, Any] | None:
+    entry = _index_cache.get(project_id)
+    if entry is None:
+        return None
+    expires_at, index, _ = entry
+    if expires_at < time.monotonic():
+        _index_cache.pop(project_id, None)
+        return None
+    return index
+
+
+def _set_cached_index(project_id: UUID, index: dict[str, Any], digest: bytes) -> None:
+    _index_cache.pop(project_id, None)
+    if len(_index_cache) >= _INDEX_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry.
+        _index_cache.pop(next(iter(_index_cache)))
+    _index_cache[project_id] = (time.monotonic() + _INDEX_CACHE_TTL_SECONDS, index, digest)
+
+
 async def list_previews_summary(storage: StorageService, project_id: UUID) -> dict[str, Any]:
     """Return a condensed view of available previews for listings."""
 
@@ -527,7 +1208,7 @@ async def save_image_previews_from_uploads(
             detail="At least one image must be provided for image-only projects",
         )
 
-    base_storage_path = _project_preview_base(project_id) / _PHOTOS_DIR
+    base_storage_path = posixpath.join(_project_preview_base(project_id), _PHOTOS_DIR)
 
     index = await load_preview_index(storage, project_id)
     existing_photos: list[dict[str, Any]] = index.get("photos", []) or []
@@ -568,7 +1249,7 @@ async def save_image_previews_from_uploads(
         safe_filename = unique_filename(slug, suffix or ".png", used_filenames)
         used_filenames.add(safe_filename)
 
-        storage_path = str(base_storage_path / safe_filename)
+        storage_path = posixpath.join(base_storage_path, safe_filename)
 
         try:
             await storage.save(storage_path, file_obj)
@@ -593,39 +1274,30 @@ async def save_image_previews_from_uploads(
             }
         )
 
-    index["photos"] = existing_photos + photos
-    await _write_index(storage, project_id, index)
+    await _write_index(storage, project_id, {**index, "photos": existing_photos + photos})
 
 
 async def validate_preview_asset_path(project_id: UUID, asset_path: str) -> str:
     """Resolve the storage path for a preview asset, validating traversal attempts."""
 
-    clean_path = _sanitize_asset_path(asset_path)
-    storage_path = _project_preview_base(project_id) / clean_path
-
-    if clean_path.suffix.lower() not in _SAFE_ASSET_SUFFIXES:
-        raise FileNotFoundError("Unsupported asset type")
-
-    return str(storage_path)
-
-
-def _sanitize_asset_path(asset_path: str) -> Path:
-    path = Path(asset_path)
-    if path.is_absolute() or any(part == ".." for part in path.parts):
+    if _ASSET_PATH_RE.fullmatch(asset_path) is None:
         raise FileNotFoundError("Invalid asset path")
-    return path
+
+    return f"{_project_preview_base(project_id)}/{asset_path}"
 
 
-def _project_preview_base(project_id: UUID) -> Path:
-    return Path("projects") / str(project_id) / _PREVIEW_DIR_NAME
+@lru_cache(maxsize=4096)
+def _project_preview_base(project_id: UUID) -> str:
+    return f"projects/{project_id}/{_PREVIEW_DIR_NAME}"
 
 
 def _preview_index_storage_path(project_id: UUID) -> str:
-    return str(_project_preview_base(project_id) / _INDEX_FILENAME)
+    return f"{_project_preview_base(project_id)}/{_INDEX_FILENAME}"
 
 
 __all__ = [
     "process_project_archive",
+    "release_render_cache",
     "load_preview_index",
     "list_previews_summary",
 ]
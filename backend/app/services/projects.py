@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
 import logging
-import os
-import shutil
+from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 from uuid import UUID
 
+import orjson
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import Select, func, select
+from pydantic import TypeAdapter
+from sqlalchemy import Select, delete, exists, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 
 from app.api.schemas.projects import (
     ProjectCreate,
@@ -20,39 +26,77 @@ from app.api.schemas.projects import (
     ProjectResponse,
     ProjectUpdate,
 )
+from app.core.config import settings
+from app.services.analytics import analytics_events
 from app.services.previews import (
     MAX_KICAD_ARCHIVE_SIZE_BYTES,
     MAX_KICAD_ARCHIVE_SIZE_MB,
     process_project_archive,
+    release_render_cache,
 )
-from app.services.storage.base import StorageService
-from db.models import Project, User, AnalyticsEvent
+from app.services.storage.base import StorageError, StorageService
+from db.models import CommentThread, Project, ProjectFile, User, uuid7
 from db.sessions import async_session_factory
 
 logger = logging.getLogger(__name__)
 
+_UPLOAD_COPY_CHUNK_BYTES = 1024 * 1024
+
+# Queued archives wait here before opening a session, so a burst of uploads
+# neither starves request handlers of DB connections nor floods the event loop.
+_processing_slots = asyncio.Semaphore(settings.project_processing_max_concurrency)
+
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[ProjectResponse])
+
+# Loads just what ProjectResponse reads from the child collections. The counts only need
+# each thread's is_resolved flag, so loading its comments is explicitly ruled out.
+_PROJECT_FILE_COLUMNS = (
+    ProjectFile.filename,
+    ProjectFile.file_type,
+    ProjectFile.storage_path,
+    ProjectFile.created_at,
+)
+_PROJECT_RESPONSE_LOADS = (
+    selectinload(Project.files).load_only(*_PROJECT_FILE_COLUMNS),
+    selectinload(Project.comment_threads).options(
+        load_only(CommentThread.is_resolved), raiseload(CommentThread.comments)
+    ),
+)
+# Single-project lookups join the small child collections into one query
+# instead of issuing a selectin round trip per relationship.
+_PROJECT_DETAIL_LOADS = (
+    joinedload(Project.files).load_only(*_PROJECT_FILE_COLUMNS),
+    joinedload(Project.comment_threads).options(
+        load_only(CommentThread.is_resolved), raiseload(CommentThread.comments)
+    ),
+)
+
 
 async def increment_project_view(
     session: AsyncSession, project_id: UUID, user_id: UUID | None = None
 ) -> None:
     """Increment project view count and record analytics event."""
-    project = await session.get(Project, project_id)
-    if project:
-        project.view_count += 1
-
-        event = AnalyticsEvent(
-            project_id=project_id,
-            event_type="project_view",
-            user_id=user_id,
-        )
-        session.add(event)
+    # A database-side increment needs no SELECT and cannot lose concurrent views.
+    result = await session.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(view_count=Project.view_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
         await session.commit()
+        analytics_events.record(project_id, "project_view", user_id)
 
 
 async def run_project_processing_task(
     storage: StorageService, project_id: UUID, local_zip_path: Path
 ) -> None:
     """Background task to process project archives."""
+    async with _processing_slots:
+        await _process_project(storage, project_id, local_zip_path)
+
+
+async def _process_project(storage: StorageService, project_id: UUID, local_zip_path: Path) -> None:
     async with async_session_factory() as session:
         try:
             project = await session.get(Project, project_id)
@@ -89,13 +133,68 @@ async def run_project_processing_task(
                 logger.warning("Failed to delete temp file %s", local_zip_path)
 
 
-async def _ensure_owner_exists(session: AsyncSession, owner_id: UUID) -> User:
-    owner = await session.get(User, owner_id)
-    if owner is None:
-        owner = User(id=owner_id)
-        session.add(owner)
-        await session.flush()
-    return owner
+def _write_upload(file_obj: BinaryIO, destination: Path, max_bytes: int) -> bool:
+    """Copy the upload to `destination`, returning False once it exceeds `max_bytes`."""
+    written = 0
+    with destination.open("wb") as buffer:
+        while chunk := file_obj.read(_UPLOAD_COPY_CHUNK_BYTES):
+            written += len(chunk)
+            if written > max_bytes:
+                return False
+            buffer.write(chunk)
+    return True
+
+
+async def _ensure_owner_exists(session: AsyncSession, owner_id: UUID) -> None:
+    await session.execute(
+        pg_insert(User).values(id=owner_id).on_conflict_do_nothing(index_elements=[User.id])
+    )
+
+
+async def _stage_upload(upload_file: UploadFile, project_id: UUID) -> Path:
+    """Validate a KiCad archive upload and copy it to a local temp path."""
+    filename = upload_file.filename
+    if not filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file must have a name",
+        )
+    if not filename.lower().endswith(".zip"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only KiCad ZIP archives are supported",
+        )
+
+    too_large = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"KiCad archive must be {MAX_KICAD_ARCHIVE_SIZE_MB} MB or smaller",
+    )
+    # The multipart parser records the size; the copy below still enforces
+    # the cap for uploads that arrive without one.
+    if upload_file.size is not None and upload_file.size > MAX_KICAD_ARCHIVE_SIZE_BYTES:
+        raise too_large
+
+    # Save to temporary location for processing
+    temp_dir = Path("/tmp/uploads")
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    upload_path = temp_dir / f"{project_id}_{filename}"
+
+    try:
+        within_limit = await asyncio.to_thread(
+            _write_upload, upload_file.file, upload_path, MAX_KICAD_ARCHIVE_SIZE_BYTES
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save uploaded file",
+        ) from exc
+    finally:
+        await upload_file.close()
+
+    if not within_limit:
+        upload_path.unlink(missing_ok=True)
+        raise too_large
+    return upload_path
 
 
 async def create_project(
@@ -104,151 +203,163 @@ async def create_project(
     upload_file: UploadFile | None,
 ) -> tuple[ProjectResponse, Path | None]:
     """Create a new project."""
-    if payload.owner_id is None:
-        owner = User()
-        session.add(owner)
-        await session.flush()
-    else:
-        owner = await _ensure_owner_exists(session, payload.owner_id)
-
-    project = Project(
-        owner_id=owner.id,
-        name=payload.name,
-        description=payload.description,
-        is_public=payload.is_public,
-        status=payload.status or "open",
-        github_repo_url=payload.github_repo_url,
-        secret_link=None,
-        tags=payload.tags,
-        source_type=payload.source_type or "kicad",
-        thumbnail_kind=payload.thumbnail_kind,
-    )
-
-    session.add(project)
-    await session.flush()
-
-    # Image-only projects skip the KiCad processing pipeline and are considered
-    # processed as soon as they are created.
-    if project.source_type == "images":
-        project.processing_status = "completed"
-        project.processing_error = None
+    project_id = uuid7()
+    source_type = payload.source_type or "kicad"
 
+    # Stage the archive before touching the database so the transaction below
+    # never stays open across the disk copy.
     upload_path: Path | None = None
+    if upload_file is not None and source_type == "kicad":
+        upload_path = await _stage_upload(upload_file, project_id)
 
-    if upload_file is not None and project.source_type == "kicad":
-        filename = upload_file.filename
-        if not filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Uploaded file must have a name",
-            )
-        if not filename.lower().endswith(".zip"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only KiCad ZIP archives are supported",
-            )
-
-        file_obj = upload_file.file
-        size_bytes: int | None = None
-        try:
-            file_obj.seek(0, os.SEEK_END)
-            size_bytes = file_obj.tell()
-        except (OSError, AttributeError):
-            size_bytes = None
-        finally:
-            try:
-                file_obj.seek(0)
-            except (OSError, AttributeError):
-                pass
-
-        if size_bytes is not None and size_bytes > MAX_KICAD_ARCHIVE_SIZE_BYTES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"KiCad archive must be {MAX_KICAD_ARCHIVE_SIZE_MB} MB or smaller",
-            )
-
-        # Save to temporary location for processing
-        temp_dir = Path("/tmp/uploads")
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        upload_path = temp_dir / f"{project.id}_{filename}"
+    try:
+        if payload.owner_id is None:
+            owner = User()
+            session.add(owner)
+            await session.flush()
+            owner_id = owner.id
+        else:
+            await _ensure_owner_exists(session, payload.owner_id)
+            owner_id = payload.owner_id
+
+        project = Project(
+            id=project_id,
+            owner_id=owner_id,
+            name=payload.name,
+            description=payload.description,
+            is_public=payload.is_public,
+            status=payload.status or "open",
+            github_repo_url=payload.github_repo_url,
+            secret_link=None,
+            tags=payload.tags,
+            source_type=source_type,
+            thumbnail_kind=payload.thumbnail_kind,
+            # A new project has no files or threads yet; initialising the collections
+            # lets the response be built without reloading them after commit.
+            files=[],
+            comment_threads=[],
+        )
 
-        try:
-            with upload_path.open("wb") as buffer:
-                shutil.copyfileobj(file_obj, buffer)
-        except Exception as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to save uploaded file",
-            ) from exc
-        finally:
-            await upload_file.close()
+        # Image-only projects skip the KiCad processing pipeline and are considered
+        # processed as soon as they are created.
+        if source_type == "images":
+            project.processing_status = "completed"
+            project.processing_error = None
 
-    try:
+        session.add(project)
         await session.commit()
     except IntegrityError as exc:
         await session.rollback()
-        # Cleanup temp file if commit fails
-        if upload_path and upload_path.exists():
-            try:
-                upload_path.unlink()
-            except OSError:
-                pass
+        if upload_path is not None:
+            upload_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to create project"
         ) from exc
+    except BaseException:
+        if upload_path is not None:
+            upload_path.unlink(missing_ok=True)
+        raise
 
-    await session.refresh(project, attribute_names=["files", "comment_threads"])
     return ProjectResponse.model_validate(project, from_attributes=True), upload_path
 
 
+def _encode_cursor(project: Project) -> str:
+    """Encode a project's (created_at, id) sort key as an opaque page cursor."""
+    raw = orjson.dumps([project.created_at.isoformat(), str(project.id)])
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a page cursor produced by `_encode_cursor`."""
+    try:
+        created_at, project_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), UUID(project_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
 async def list_projects(
     session: AsyncSession,
     *,
     page: int,
     size: int,
+    cursor: str | None = None,
     only_public: bool | None = None,
     owner_id: UUID | None = None,
     status: str | None = None,
 ) -> ProjectListResponse:
-    """List projects."""
+    """List projects.
+
+    Passing the `next_cursor` of a previous response seeks straight to the
+    following page via the (created_at, id) index; `page` is only used for
+    offset-based requests without a cursor.
+    """
     if page < 1 or size < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid pagination parameters",
         )
 
-    query: Select[tuple[Project]] = (
-        select(Project)
-        .options(selectinload(Project.files), selectinload(Project.comment_threads))
-        .order_by(Project.created_at.desc())
-    )
-
+    filters = []
     if only_public is not None:
-        query = query.where(Project.is_public.is_(only_public))
-    total_query = select(func.count(Project.id))  # pylint: disable=not-callable
+        # Bare `is_public` matches the predicate of the partial public-listing index.
+        filters.append(Project.is_public if only_public else ~Project.is_public)
     if owner_id is not None:
-        query = query.where(Project.owner_id == owner_id)
-        total_query = total_query.where(Project.owner_id == owner_id)
+        filters.append(Project.owner_id == owner_id)
     if status is not None:
-        query = query.where(Project.status == status)
-        total_query = total_query.where(Project.status == status)
-    if only_public is not None:
-        total_query = total_query.where(Project.is_public.is_(only_public))
-
-    total_result = await session.execute(total_query)
-    total = total_result.scalar_one() or 0
-
-    offset = (page - 1) * size
-    project_result = await session.execute(query.offset(offset).limit(size))
-    projects = project_result.scalars().all()
+        filters.append(Project.status == status)
+
+    if cursor is not None:
+        # Keyset pages never need the total: probe one extra row to learn
+        # whether another page follows.
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query: Select[tuple[Project]] = (
+            select(Project)
+            .options(*_PROJECT_RESPONSE_LOADS, raiseload("*"))
+            .where(
+                *filters,
+                tuple_(Project.created_at, Project.id) < tuple_(cursor_created_at, cursor_id),
+            )
+            .order_by(Project.created_at.desc(), Project.id.desc())
+            .limit(size + 1)
+        )
+        projects = list((await session.execute(query)).scalars().all())
+        has_more = len(projects) > size
+        projects = projects[:size]
+        total: int | None = None
+    else:
+        # The window count is evaluated before OFFSET/LIMIT, so one statement
+        # returns both the page and the filtered total.
+        total_column = func.count().over().label("total")  # pylint: disable=not-callable
+        paged_query = (
+            select(Project, total_column)
+            .options(*_PROJECT_RESPONSE_LOADS, raiseload("*"))
+            .where(*filters)
+            .order_by(Project.created_at.desc(), Project.id.desc())
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+        rows = (await session.execute(paged_query)).all()
+        projects = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif page == 1:
+            total = 0
+        else:
+            # Past the last page there are no rows to carry the window count.
+            total_query = select(func.count(Project.id)).where(*filters)  # pylint: disable=not-callable
+            total = (await session.execute(total_query)).scalar_one() or 0
+        has_more = (page - 1) * size + len(projects) < total
 
     return ProjectListResponse(
-        items=[
-            ProjectResponse.model_validate(project, from_attributes=True) for project in projects
-        ],
+        items=_PROJECT_LIST_ADAPTER.validate_python(projects, from_attributes=True),
         total=total,
         page=page,
         size=size,
+        next_cursor=_encode_cursor(projects[-1]) if has_more else None,
     )
 
 
@@ -265,19 +376,34 @@ async def update_project(
     current_user_id: UUID,
 ) -> ProjectResponse:
     """Update a project."""
-    project = await get_project_orm_model(session, project_id)
+    values = payload.model_dump(exclude_unset=True, exclude_none=True)
+    forbidden = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You are not allowed to modify this project",
+    )
 
-    if project.owner_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not allowed to modify this project",
-        )
+    if not values:
+        project = await get_project_orm_model(session, project_id)
+        if project.owner_id != current_user_id:
+            raise forbidden
+        return ProjectResponse.model_validate(project, from_attributes=True)
 
-    for field, value in payload.model_dump(exclude_unset=True, exclude_none=True).items():
-        setattr(project, field, value)
+    # Ownership is part of the WHERE clause, so one UPDATE both authorises and
+    # applies the change.
+    result = await session.execute(
+        update(Project)
+        .where(Project.id == project_id, Project.owner_id == current_user_id)
+        .values(**values)
+        .returning(Project.id)
+    )
+    if result.scalar_one_or_none() is None:
+        await ensure_project_exists(session, project_id)
+        raise forbidden
 
+    # The response collections come from the same loaders as a plain lookup rather
+    # than relying on loader options being applied to UPDATE ... RETURNING.
+    project = await get_project_orm_model(session, project_id)
     await session.commit()
-    await session.refresh(project, attribute_names=["files", "comment_threads"])
     return ProjectResponse.model_validate(project, from_attributes=True)
 
 
@@ -298,24 +424,26 @@ async def delete_project(
 
     file_paths = [file.storage_path for file in project.files]
 
-    await session.delete(project)
+    # A bulk DELETE leaves child rows to the ON DELETE CASCADE foreign keys; an ORM
+    # delete would load every unloaded collection and try to NULL its project_id.
+    await session.execute(
+        delete(Project).where(Project.id == project_id).execution_options(synchronize_session=False)
+    )
     await session.commit()
 
-    for path in file_paths:
-        try:
-            await storage.delete(path)
-        except Exception:
-            continue
+    await release_render_cache(storage, project_id)
+    try:
+        await storage.delete_many(file_paths)
+    except StorageError:
+        logger.warning("Failed to delete stored files for project %s", project_id, exc_info=True)
 
 
 async def get_project_orm_model(session: AsyncSession, project_id: UUID) -> Project:
     """Get a project model."""
     result = await session.execute(
-        select(Project)
-        .options(selectinload(Project.files), selectinload(Project.comment_threads))
-        .where(Project.id == project_id)
+        select(Project).options(*_PROJECT_DETAIL_LOADS).where(Project.id == project_id)
     )
-    project = result.scalar_one_or_none()
+    project = result.unique().scalar_one_or_none()
     if project is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     return project
@@ -323,7 +451,6 @@ async def get_project_orm_model(session: AsyncSession, project_id: UUID) -> Proj
 
 async def ensure_project_exists(session: AsyncSession, project_id: UUID) -> None:
     """Ensure a project exists."""
-    query = select(Project.id).where(Project.id == project_id)
-    result = await session.execute(query)
-    if result.scalar_one_or_none() is None:
+    result = await session.execute(select(exists().where(Project.id == project_id)))
+    if not result.scalar_one():
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from uuid import UUID
 
+from fastapi import HTTPException, status
 from sqlalchemy import Select, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.reviews import (
@@ -12,8 +14,28 @@ from app.api.schemas.reviews import (
     ReviewListResponse,
     ReviewResponse,
 )
-from app.services.projects import ensure_project_exists
-from db.models import Review
+from db.models import Project, Review
+
+# Large review lists are fetched through a server-side cursor in batches of this size.
+_REVIEW_FETCH_BATCH = 200
+
+# Listing selects exactly the response columns, so rows map straight onto
+# ReviewResponse without materialising Review instances.
+_REVIEW_RESPONSE_COLUMNS = tuple(getattr(Review, name) for name in ReviewResponse.model_fields)
+
+_FOREIGN_KEY_VIOLATION = "23503"
+# Postgres' default name for the unnamed reviews.project_id foreign key.
+_REVIEW_PROJECT_FK = "reviews_project_id_fkey"
+
+
+def _is_missing_project(exc: IntegrityError) -> bool:
+    """Whether an insert failed on the project foreign key rather than any other constraint."""
+    # SQLAlchemy chains the driver's own exception, which carries the sqlstate and constraint.
+    cause = getattr(exc.orig, "__cause__", None)
+    return (
+        getattr(cause, "sqlstate", None) == _FOREIGN_KEY_VIOLATION
+        and getattr(cause, "constraint_name", None) == _REVIEW_PROJECT_FK
+    )
 
 
 async def create_review(
@@ -30,8 +52,6 @@ async def create_review(
         payload: Review content and metadata.
         reviewer_id: ID of the authenticated user creating the review.
     """
-    await ensure_project_exists(session, project_id)
-
     review = Review(
         project_id=project_id,
         reviewer_id=reviewer_id,
@@ -41,9 +61,17 @@ async def create_review(
         is_private=payload.is_private,
     )
 
+    # The project foreign key doubles as the existence check on this write path.
     session.add(review)
-    await session.commit()
-    await session.refresh(review)
+    try:
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        if not _is_missing_project(exc):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        ) from exc
 
     return ReviewResponse.model_validate(review, from_attributes=True)
 
@@ -53,15 +81,24 @@ async def list_reviews(
     project_id: UUID,
 ) -> ReviewListResponse:
     """List all reviews for a project."""
-    await ensure_project_exists(session, project_id)
-
-    query: Select[tuple[Review]] = (
-        select(Review).where(Review.project_id == project_id).order_by(Review.created_at.asc())
+    # Anchoring on the project row checks existence in the same query: no rows means
+    # no project, and a single all-NULL row means a project without reviews.
+    query: Select = (
+        select(*_REVIEW_RESPONSE_COLUMNS)
+        .select_from(Project)
+        .outerjoin(Review, Review.project_id == Project.id)
+        .where(Project.id == project_id)
+        .order_by(Review.created_at.asc())
     )
-    result = await session.execute(query)
-    reviews = result.scalars().all()
+    result = await session.stream(query.execution_options(yield_per=_REVIEW_FETCH_BATCH))
+    project_found = False
+    items: list[ReviewResponse] = []
+    async for row in result.mappings():
+        project_found = True
+        if row["id"] is not None:
+            # Rows come straight from typed columns, so validation would only re-check them.
+            items.append(ReviewResponse.model_construct(**row))
+    if not project_found:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
 
-    return ReviewListResponse(
-        project_id=project_id,
-        items=[ReviewResponse.model_validate(review, from_attributes=True) for review in reviews],
-    )
+    return ReviewListResponse(project_id=project_id, items=items)
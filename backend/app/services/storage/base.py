@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Protocol
 
@@ -28,13 +29,17 @@ class StorageService(ABC):
     """Abstract storage service defining required methods."""
 
     @abstractmethod
-    async def save(self, path: str, file_obj: StorageFile) -> str:
-        """Persist the file object under the given path and return canonical location."""
+    async def save(self, path: str, file_obj: StorageFile | bytes) -> str:
+        """Persist the file object or raw bytes under the given path and return canonical location."""
 
     @abstractmethod
     async def upload(self, path: str, file_path: Path) -> str:
         """Upload a local file to the storage."""
 
+    @abstractmethod
+    async def copy(self, source_path: str, destination_path: str) -> str:
+        """Copy an object already in storage to another path."""
+
     @abstractmethod
     async def download(self, path: str, destination: Path) -> None:
         """Download the file from storage to a local destination."""
@@ -43,6 +48,10 @@ class StorageService(ABC):
     async def delete(self, path: str) -> None:
         """Remove the object at the given path if it exists."""
 
+    @abstractmethod
+    async def delete_many(self, paths: Sequence[str]) -> None:
+        """Remove every existing object in `paths`, attempting all before raising."""
+
     @abstractmethod
     async def get_url(self, path: str) -> str | None:
         """Return a public URL for the stored object, if available."""
@@ -54,3 +63,6 @@ class StorageService(ABC):
     @abstractmethod
     def filesystem_path(self, path: str) -> Path:
         """Return the concrete filesystem path (for local backends)."""
+
+    async def close(self) -> None:
+        """Release resources held by the backend (thread pools, clients)."""
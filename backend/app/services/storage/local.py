@@ -3,32 +3,113 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import shutil
+import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import urljoin
+from typing import TypeVar
 
 from app.services.storage.base import StorageError, StorageFile, StorageService
 
 
+_SENDFILE_CHUNK_BYTES = 8 * 1024 * 1024
+_MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_T = TypeVar("_T")
+
+
+def _is_safe_relative_path(path: str) -> bool:
+    """Return whether `path` stays inside the storage root (relative, no `..` segments)."""
+    return not path.startswith("/") and ".." not in path.split("/")
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    """Copy a file, letting the kernel clone extents via copy_file_range where supported.
+
+    On reflink-capable filesystems (XFS, Btrfs) this shares blocks instead of moving bytes;
+    anywhere copy_file_range is unavailable or refuses (e.g. EXDEV on older kernels) it
+    falls back to shutil.copyfile, which itself uses sendfile on Linux.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with source.open("rb") as src, destination.open("wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        # Short copy (e.g. the source shrank or the filesystem refused);
+                        # redo the whole copy below rather than leave a truncated file.
+                        raise OSError("copy_file_range stopped before the end of the file")
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
+
+
+def _disk_fileno(file_obj: StorageFile) -> int | None:
+    """Return the descriptor of a file object already backed by a real file.
+
+    Spooled uploads that still live in memory report `_rolled = False`; asking
+    them for a descriptor would force a pointless rollover to disk.
+    """
+    if sys.platform != "linux" or not getattr(file_obj, "_rolled", True):
+        return None
+    try:
+        return file_obj.fileno()  # type: ignore[attr-defined]
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _sendfile_all(source_fd: int, destination_fd: int) -> None:
+    """Copy `source_fd` from offset 0 to `destination_fd` inside the kernel."""
+    offset = 0
+    while sent := os.sendfile(destination_fd, source_fd, offset, _SENDFILE_CHUNK_BYTES):
+        offset += sent
+
+
 class LocalStorage(StorageService):
     """Store files on the local filesystem."""
 
     def __init__(self, base_path: Path, public_base_url: str | None = None) -> None:
         self._base_path = base_path
-        self._public_base_url = public_base_url.rstrip("/") if public_base_url else None
+        # Stored with a trailing slash so get_url can append storage paths directly.
+        self._public_base_url = f"{public_base_url.rstrip('/')}/" if public_base_url else None
         self._base_path.mkdir(parents=True, exist_ok=True)
+        # A dedicated pool keeps slow disk I/O from queueing behind (or starving) other
+        # users of the loop's default executor.
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_IO_WORKERS, thread_name_prefix="local-storage"
+        )
+
+    async def _run(self, func: Callable[[], _T]) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def close(self) -> None:
+        # Waiting for queued file operations must not block the loop.
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
 
-    async def save(self, path: str, file_obj: StorageFile) -> str:
+    async def save(self, path: str, file_obj: StorageFile | bytes) -> str:
         destination = self.filesystem_path(path)
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         def _write() -> None:
+            if isinstance(file_obj, bytes):
+                destination.write_bytes(file_obj)
+                return
+
             try:
                 file_obj.seek(0)
             except (AttributeError, OSError):
                 pass
 
+            source_fd = _disk_fileno(file_obj)
             with destination.open("wb") as output:
+                if source_fd is not None:
+                    _sendfile_all(source_fd, output.fileno())
+                    return
                 while True:
                     chunk = file_obj.read(1024 * 1024)
                     if not chunk:
@@ -38,7 +119,7 @@ class LocalStorage(StorageService):
                     output.write(chunk)
 
         try:
-            await asyncio.to_thread(_write)
+            await self._run(_write)
         except Exception as exc:
             raise StorageError("Failed to save file") from exc
 
@@ -50,16 +131,33 @@ class LocalStorage(StorageService):
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         def _copy() -> None:
-            with file_path.open("rb") as src, destination.open("wb") as dst:
-                shutil.copyfileobj(src, dst)
+            _copy_file(file_path, destination)
 
         try:
-            await asyncio.to_thread(_copy)
+            await self._run(_copy)
         except Exception as exc:
             raise StorageError("Failed to upload file") from exc
 
         return path
 
+    async def copy(self, source_path: str, destination_path: str) -> str:
+        """Copy an object already in storage to another path."""
+        source = self.filesystem_path(source_path)
+        if not source.exists():
+            raise StorageError(f"File not found: {source_path}")
+        destination = self.filesystem_path(destination_path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        def _copy() -> None:
+            _copy_file(source, destination)
+
+        try:
+            await self._run(_copy)
+        except Exception as exc:
+            raise StorageError("Failed to copy file") from exc
+
+        return destination_path
+
     async def download(self, path: str, destination: Path) -> None:
         """Download the file from storage to a local destination."""
         source = self.filesystem_path(path)
@@ -70,7 +168,7 @@ class LocalStorage(StorageService):
             shutil.copy(source, destination)
 
         try:
-            await asyncio.to_thread(_copy)
+            await self._run(_copy)
         except Exception as exc:
             raise StorageError("Failed to download file") from exc
 
@@ -83,30 +181,42 @@ class LocalStorage(StorageService):
             target.unlink()
 
         try:
-            await asyncio.to_thread(_delete)
+            await self._run(_delete)
         except Exception as exc:
             raise StorageError("Failed to delete file") from exc
 
-    async def read(self, path: str) -> bytes:
-        source = self.filesystem_path(path)
-        if not source.exists():
-            raise StorageError(f"File not found: {path}")
+    async def delete_many(self, paths: Sequence[str]) -> None:
+        targets = [self.filesystem_path(path) for path in paths]
+
+        def _delete_all() -> list[Path]:
+            failed: list[Path] = []
+            for target in targets:
+                try:
+                    target.unlink(missing_ok=True)
+                except OSError:
+                    failed.append(target)
+            return failed
 
-        def _read() -> bytes:
-            return source.read_bytes()
+        failed = await self._run(_delete_all)
+        if failed:
+            raise StorageError(f"Failed to delete {len(failed)} of {len(targets)} files")
 
+    async def read(self, path: str) -> bytes:
+        source = self.filesystem_path(path)
+        # Opening the file doubles as the existence check, so a read is one executor hop.
         try:
-            return await asyncio.to_thread(_read)
+            return await self._run(source.read_bytes)
+        except FileNotFoundError as exc:
+            raise StorageError(f"File not found: {path}") from exc
         except Exception as exc:
             raise StorageError("Failed to read file") from exc
 
     async def get_url(self, path: str) -> str | None:
         if not self._public_base_url:
             return None
-        return urljoin(f"{self._public_base_url}/", path)
+        return self._public_base_url + path.lstrip("/")
 
     def filesystem_path(self, path: str) -> Path:
-        safe_path = Path(path)
-        if safe_path.is_absolute() or ".." in safe_path.parts:
+        if not _is_safe_relative_path(path):
             raise StorageError("Invalid storage path")
-        return self._base_path / safe_path
+        return self._base_path / path
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import math
 import re
-from copy import deepcopy
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from xml.etree import ElementTree as ET
@@ -12,6 +12,17 @@ from xml.etree import ElementTree as ET
 _SVG_NAMESPACE = "http://www.w3.org/2000/svg"
 ET.register_namespace("", _SVG_NAMESPACE)
 _DIMENSION_RE = re.compile(r"([0-9.+-eE]+)")
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_TITLE_SCAN_BYTES = 64 * 1024
+_HEADER_CHUNK_BYTES = 4096
+# Splits a sheet into its root <svg> attributes and body so the body can be copied verbatim.
+# Quoted attribute values may legally contain ">", so they are matched as whole tokens.
+_SVG_OUTER_RE = re.compile(
+    rb"""^.*?<svg\b(?P<attrs>(?:[^>"']|"[^"]*"|'[^']*')*)>(?P<body>.*)</svg>\s*$""", re.DOTALL
+)
+_VIEWBOX_ATTR_RE = re.compile(rb"""\sviewBox\s*=\s*(?:"[^"]*"|'[^']*')""")
+_XMLNS_ATTR_RE = re.compile(rb"""\sxmlns(?::[\w.-]+)?\s*=\s*(?:"[^"]*"|'[^']*')""")
+_XML_ENCODING_RE = re.compile(rb"""^<\?xml[^>]*\bencoding\s*=\s*["']([\w.-]+)""", re.IGNORECASE)
 
 
 @dataclass(slots=True)
@@ -22,13 +33,48 @@ class SvgDimensions:
 
 def parse_svg_dimensions(svg: ET.ElementTree) -> SvgDimensions:
     """Extract width/height for an SVG element, falling back to viewBox if needed."""
-    root = svg.getroot()
+    return _dimensions_from_root(svg.getroot())
+
+
+def read_svg_dimensions(svg: Path | bytes) -> SvgDimensions:
+    """Read SVG dimensions from the root element without parsing the rest of the document."""
+    parser = ET.XMLPullParser(events=("start",))
+    if isinstance(svg, bytes):
+        # Feeding the whole document at once would make expat parse all of it before the
+        # first event is read; slicing stops after the header like the file path does.
+        chunks: Iterable[bytes] = (
+            svg[offset : offset + _HEADER_CHUNK_BYTES]
+            for offset in range(0, len(svg), _HEADER_CHUNK_BYTES)
+        )
+    else:
+        chunks = _iter_file_chunks(svg)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            return _dimensions_from_root(element)
+
+    raise ValueError("Unable to determine SVG dimensions")
+
+
+def _iter_file_chunks(path: Path, chunk_size: int = _HEADER_CHUNK_BYTES) -> Iterator[bytes]:
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+def _dimensions_from_root(root: ET.Element) -> SvgDimensions:
     width_attr = root.get("width")
     height_attr = root.get("height")
 
     def _parse(value: str | None) -> float | None:
         if not value:
             return None
+        # Most sheets carry plain numbers; only unit-suffixed values need the regex.
+        try:
+            return float(value)
+        except ValueError:
+            pass
         match = _DIMENSION_RE.search(value)
         if not match:
             return None
@@ -45,7 +91,7 @@ def parse_svg_dimensions(svg: ET.ElementTree) -> SvgDimensions:
 
     viewbox = root.get("viewBox")
     if viewbox:
-        parts = [p for p in re.split(r"[\s,]+", viewbox.strip()) if p]
+        parts = viewbox.replace(",", " ").split()
         if len(parts) == 4:
             try:
                 _, _, vb_width, vb_height = map(float, parts)
@@ -65,24 +111,29 @@ def grid_dimensions(count: int) -> tuple[int, int]:
     return rows, columns
 
 
-def compose_svg_grid(svgs: list[Path], destination: Path, *, padding_ratio: float = 0.05) -> Path:
-    """Combine multiple SVG sheets into a single grid-based SVG."""
-    trees: list[ET.ElementTree] = []
+def compose_svg_grid(
+    svgs: list[Path | bytes], destination: Path, *, padding_ratio: float = 0.05
+) -> Path:
+    """Combine multiple SVG sheets into a single grid-based SVG.
+
+    Sheets may be given as paths or as already-read SVG bytes. The destination's parent
+    directory must already exist.
+    """
+    # Dimensions only need the root element, so every sheet is checked before any full parse.
     dimensions: list[SvgDimensions] = []
-    for svg_path in svgs:
-        tree = ET.parse(svg_path)
-        trees.append(tree)
+    for position, svg in enumerate(svgs, start=1):
         try:
-            dimensions.append(parse_svg_dimensions(tree))
-        except ValueError as exc:
-            raise RuntimeError(f"Unable to read dimensions from {svg_path}") from exc
+            dimensions.append(read_svg_dimensions(svg))
+        except (ValueError, ET.ParseError) as exc:
+            source = svg if isinstance(svg, Path) else f"sheet {position}"
+            raise RuntimeError(f"Unable to read dimensions from {source}") from exc
 
-    if not trees:
+    if not dimensions:
         raise RuntimeError("No SVGs supplied for composition")
 
     max_width = max(dim.width for dim in dimensions)
     max_height = max(dim.height for dim in dimensions)
-    rows, cols = grid_dimensions(len(trees))
+    rows, cols = grid_dimensions(len(dimensions))
 
     padding_x = max_width * padding_ratio
     padding_y = max_height * padding_ratio
@@ -93,57 +144,88 @@ def compose_svg_grid(svgs: list[Path], destination: Path, *, padding_ratio: floa
     total_width = cols * cell_width - padding_x
     total_height = rows * cell_height - padding_y
 
-    root = ET.Element(
-        "{%s}svg" % _SVG_NAMESPACE,
-        attrib={
-            "width": f"{total_width}",
-            "height": f"{total_height}",
-            "viewBox": f"0 0 {total_width} {total_height}",
-            "version": "1.1",
-        },
-    )
-
-    for index, (tree, dim) in enumerate(zip(trees, dimensions, strict=True)):
-        row = index // cols
-        col = index % cols
-        translate_x = col * cell_width
-        translate_y = row * cell_height
-
-        group = ET.SubElement(
-            root,
-            "{%s}g" % _SVG_NAMESPACE,
-            attrib={"transform": f"translate({translate_x},{translate_y})"},
-        )
+    # Sheets are read and written one at a time, so only a single sheet is in memory.
+    try:
+        with destination.open("wb") as output:
+            output.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+            output.write(
+                f'<svg xmlns="{_SVG_NAMESPACE}" width="{total_width}" height="{total_height}" '
+                f'viewBox="0 0 {total_width} {total_height}" version="1.1">'.encode()
+            )
+
+            for index, (svg, dim) in enumerate(zip(svgs, dimensions, strict=True)):
+                row = index // cols
+                col = index % cols
+                # A nested <svg> viewport places and scales the sheet in one step.
+                viewport = (
+                    f'x="{col * cell_width}" y="{row * cell_height}" '
+                    f'width="{max_width}" height="{max_height}" '
+                    'preserveAspectRatio="xMidYMid meet"'
+                )
+
+                content = svg if isinstance(svg, bytes) else svg.read_bytes()
+                output.write(_sheet_viewport(content, viewport, dim))
+
+            output.write(b"</svg>")
+    except BaseException:
+        # Never leave a truncated grid behind for the caller to publish.
+        destination.unlink(missing_ok=True)
+        raise
+
+    return destination
 
-        scale_x = max_width / dim.width if dim.width else 1.0
-        scale_y = max_height / dim.height if dim.height else 1.0
-        uniform_scale = min(scale_x, scale_y)
 
-        scale_transform = ""
-        if not math.isclose(uniform_scale, 1.0):
-            scale_transform = f" scale({uniform_scale})"
+def _sheet_viewport(content: bytes, viewport: str, dim: SvgDimensions) -> bytes:
+    """Wrap one sheet's drawing in a nested <svg> viewport for the composed grid.
+
+    The sheet keeps its own viewBox, so the viewport maps it onto the grid cell. The body is
+    spliced in as raw bytes; its namespace declarations move onto the viewport so prefixed
+    attributes stay bound. Sheets that cannot be split that way (non-UTF-8 encodings,
+    unexpected markup) are re-serialised through ElementTree.
+    """
+    match = _SVG_OUTER_RE.match(content)
+    encoding = _XML_ENCODING_RE.match(content)
+    if match and (encoding is None or encoding.group(1).lower() in (b"utf-8", b"utf8")):
+        attrs = match.group("attrs")
+        view_box = _VIEWBOX_ATTR_RE.search(attrs)
+        namespaces = b"".join(_XMLNS_ATTR_RE.findall(attrs))
+        return b"".join(
+            (
+                f"<svg {viewport}".encode(),
+                view_box.group(0) if view_box else _default_view_box(dim).encode(),
+                namespaces,
+                b">",
+                content[match.start("body") : match.end("body")],
+                b"</svg>",
+            )
+        )
 
-        sheet_group = ET.SubElement(group, "{%s}g" % _SVG_NAMESPACE)
-        if scale_transform:
-            sheet_group.set("transform", scale_transform.strip())
+    root = ET.fromstring(content)
+    sheet = ET.fromstring(f'<svg xmlns="{_SVG_NAMESPACE}" {viewport}{_default_view_box(dim)}/>')
+    if root.get("viewBox"):
+        sheet.set("viewBox", root.get("viewBox"))
+    sheet.extend(root)
+    return ET.tostring(sheet, encoding="utf-8", xml_declaration=False)
 
-        for child in deepcopy(list(tree.getroot())):
-            sheet_group.append(child)
 
-    composed_tree = ET.ElementTree(root)
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    composed_tree.write(destination, encoding="utf-8", xml_declaration=True)
-    return destination
+def _default_view_box(dim: SvgDimensions) -> str:
+    return f' viewBox="0 0 {dim.width} {dim.height}"'
 
 
-def derive_sheet_title(svg_file: Path) -> str:
-    """Extract title from SVG metadata or fallback to filename."""
-    try:
-        content = svg_file.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return svg_file.stem
+def derive_sheet_title(svg_file: Path, data: bytes | None = None) -> str:
+    """Extract title from SVG metadata or fallback to filename.
+
+    Pass ``data`` when the file has already been read to avoid reading it again. KiCad emits
+    the title near the top of the document, so only the first few KiB are searched.
+    """
+    if data is None:
+        try:
+            with svg_file.open("rb") as handle:
+                data = handle.read(_TITLE_SCAN_BYTES)
+        except OSError:
+            return svg_file.stem
 
-    match = re.search(r"<title>(.*?)</title>", content, flags=re.IGNORECASE)
+    match = _TITLE_RE.search(data, 0, _TITLE_SCAN_BYTES)
     if match:
-        return match.group(1).strip()
+        return match.group(1).decode("utf-8", errors="ignore").strip()
     return svg_file.stem
@@ -5,12 +5,14 @@ from __future__ import annotations
 import re
 import unicodedata
 
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
 
 def slugify(value: str) -> str:
     """Convert a string to a slug."""
     normalized = unicodedata.normalize("NFKD", value)
     ascii_value = normalized.encode("ascii", "ignore").decode("ascii")
-    slug = re.sub(r"[^a-z0-9]+", "-", ascii_value.lower()).strip("-")
+    slug = _SLUG_SEPARATOR_RE.sub("-", ascii_value.lower()).strip("-")
     return slug or "sheet"
 
 
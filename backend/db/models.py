@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import time
 from datetime import datetime
-from uuid import UUID as UUIDType, uuid4
+from uuid import UUID as UUIDType
 
 from sqlalchemy import (
     TIMESTAMP,
@@ -15,11 +17,24 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
+def uuid7() -> UUIDType:
+    """Generate a time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms timestamp, then random bits.
+
+    New rows land at the right edge of the primary-key B-tree instead of random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+    return UUIDType(int=value)
+
+
 class Base(DeclarativeBase):
     """Base declarative class for all models."""
 
@@ -27,15 +42,18 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin providing created/updated timestamps."""
 
+    # Timestamps are set by Postgres; eager defaults read them back via RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
-        default=datetime.now,
+        server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
-        default=datetime.now,
-        onupdate=datetime.now,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -43,60 +61,92 @@ class TimestampMixin:
 class User(TimestampMixin, Base):
     __tablename__ = "users"
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email: Mapped[str | None] = mapped_column(String, unique=True)
-    display_name: Mapped[str | None] = mapped_column(String)
-    avatar_url: Mapped[str | None] = mapped_column(String)
+    display_name: Mapped[str | None] = mapped_column(String(255))
+    avatar_url: Mapped[str | None] = mapped_column(String(500))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
-    projects: Mapped[list["Project"]] = relationship(back_populates="owner")
-    reviews: Mapped[list["Review"]] = relationship(back_populates="reviewer")
+    projects: Mapped[list["Project"]] = relationship(
+        back_populates="owner", lazy="raise_on_sql", passive_deletes=True
+    )
+    reviews: Mapped[list["Review"]] = relationship(
+        back_populates="reviewer", lazy="raise_on_sql", passive_deletes=True
+    )
     comment_threads: Mapped[list["CommentThread"]] = relationship(
         back_populates="created_by",
         foreign_keys="CommentThread.created_by_id",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     resolved_comment_threads: Mapped[list["CommentThread"]] = relationship(
         back_populates="resolved_by",
         foreign_keys="CommentThread.resolved_by_id",
         viewonly=True,
+        lazy="raise_on_sql",
+    )
+    thread_comments: Mapped[list["ThreadComment"]] = relationship(
+        back_populates="author", lazy="raise_on_sql", passive_deletes=True
     )
-    thread_comments: Mapped[list["ThreadComment"]] = relationship(back_populates="author")
     notifications: Mapped[list["Notification"]] = relationship(
-        back_populates="user", foreign_keys="Notification.user_id"
+        back_populates="user",
+        foreign_keys="Notification.user_id",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
 
 class Project(TimestampMixin, Base):
+    # Stored with fillfactor=70 (set by migration) so view_count and status updates can
+    # stay on the same page as HOT updates.
     __tablename__ = "projects"
     __table_args__ = (
         UniqueConstraint("secret_link", name="uq_projects_secret_link"),
-        Index("idx_projects_public", "is_public"),
+        Index("idx_projects_created_at_id", "created_at", "id"),
+        Index("idx_projects_owner_created_at", "owner_id", "created_at", "id"),
+        Index("idx_projects_status_created_at", "status", "created_at", "id"),
+        Index(
+            "idx_projects_public_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("is_public"),
+        ),
     )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     owner_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    name: Mapped[str] = mapped_column(String, nullable=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     kicad_zip_path: Mapped[str | None] = mapped_column(String)
-    github_repo_url: Mapped[str | None] = mapped_column(String)
+    github_repo_url: Mapped[str | None] = mapped_column(String(500))
     is_public: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    secret_link: Mapped[str | None] = mapped_column(String)
-    status: Mapped[str] = mapped_column(String, default="open", nullable=False)
+    secret_link: Mapped[str | None] = mapped_column(String(128))
+    status: Mapped[str] = mapped_column(String(50), default="open", nullable=False)
     tags: Mapped[list[str] | None] = mapped_column(JSON)
-    source_type: Mapped[str] = mapped_column(String, default="kicad", nullable=False)
-    thumbnail_kind: Mapped[str | None] = mapped_column(String)
+    source_type: Mapped[str] = mapped_column(String(50), default="kicad", nullable=False)
+    thumbnail_kind: Mapped[str | None] = mapped_column(String(50))
     view_count: Mapped[int] = mapped_column(default=0, nullable=False)
-    processing_status: Mapped[str] = mapped_column(String, default="queued", nullable=False)
+    processing_status: Mapped[str] = mapped_column(String(50), default="queued", nullable=False)
     processing_error: Mapped[str | None] = mapped_column(Text)
 
-    owner: Mapped[User] = relationship(back_populates="projects")
-    reviews: Mapped[list["Review"]] = relationship(back_populates="project")
-    comment_threads: Mapped[list["CommentThread"]] = relationship(back_populates="project")
-    analytics_events: Mapped[list["AnalyticsEvent"]] = relationship(back_populates="project")
-    files: Mapped[list["ProjectFile"]] = relationship(back_populates="project")
-    notifications: Mapped[list["Notification"]] = relationship(back_populates="project")
+    owner: Mapped[User] = relationship(back_populates="projects", lazy="raise_on_sql")
+    reviews: Mapped[list["Review"]] = relationship(
+        back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
+    comment_threads: Mapped[list["CommentThread"]] = relationship(
+        back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
+    analytics_events: Mapped[list["AnalyticsEvent"]] = relationship(
+        back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
+    files: Mapped[list["ProjectFile"]] = relationship(
+        back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
+    notifications: Mapped[list["Notification"]] = relationship(
+        back_populates="project", lazy="raise_on_sql", passive_deletes=True
+    )
 
     @property
     def open_comment_count(self) -> int:
@@ -111,9 +161,9 @@ class Project(TimestampMixin, Base):
 
 class Review(TimestampMixin, Base):
     __tablename__ = "reviews"
-    __table_args__ = (Index("idx_reviews_project", "project_id"),)
+    __table_args__ = (Index("idx_reviews_project_created", "project_id", "created_at"),)
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
@@ -122,36 +172,62 @@ class Review(TimestampMixin, Base):
     reviewer_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    target_file: Mapped[str | None] = mapped_column(String)
-    target_component: Mapped[str | None] = mapped_column(String)
+    target_file: Mapped[str | None] = mapped_column(String(255))
+    target_component: Mapped[str | None] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text, nullable=False)
     is_private: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    project: Mapped[Project] = relationship(back_populates="reviews")
-    reviewer: Mapped[User] = relationship(back_populates="reviews")
+    project: Mapped[Project] = relationship(back_populates="reviews", lazy="raise_on_sql")
+    reviewer: Mapped[User] = relationship(back_populates="reviews", lazy="raise_on_sql")
 
 
 class AnalyticsEvent(Base):
     __tablename__ = "analytics"
     __table_args__ = (
-        Index("idx_analytics_project", "project_id"),
+        Index(
+            "idx_analytics_proj_event_ts",
+            "project_id",
+            "event_type",
+            "event_timestamp",
+            postgresql_include=["user_id"],
+        ),
         Index("idx_analytics_event", "event_type"),
+        # Rows arrive in timestamp order, so a BRIN index prunes time ranges at a tiny
+        # fraction of a B-tree's size.
+        Index(
+            "brin_analytics_ts",
+            "event_timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "idx_analytics_meta_gin",
+            "meta",
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+        ),
+        # Monthly partitions (analytics_YYYY_MM) are created by migrations and on demand
+        # by app.services.analytics before events are written.
+        {"postgresql_partition_by": "RANGE (event_timestamp)"},
     )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
     )
-    event_type: Mapped[str] = mapped_column(String, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Part of the primary key because a partitioned table's unique keys must include
+    # the partition column. The analytics buffer stamps events when they are recorded;
+    # other inserts fall back to the database clock.
     event_timestamp: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), default=datetime.utcnow, nullable=False
+        TIMESTAMP(timezone=True), primary_key=True, server_default=func.now(), nullable=False
     )
     user_id: Mapped[UUIDType | None] = mapped_column(UUID(as_uuid=True))
-    meta: Mapped[dict | None] = mapped_column(JSON)
+    meta: Mapped[dict | None] = mapped_column(JSONB)
 
-    project: Mapped[Project] = relationship(back_populates="analytics_events")
+    project: Mapped[Project] = relationship(back_populates="analytics_events", lazy="raise_on_sql")
 
 
 class ProjectFile(TimestampMixin, Base):
@@ -161,7 +237,7 @@ class ProjectFile(TimestampMixin, Base):
         Index("idx_project_files_project", "project_id"),
     )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
@@ -171,17 +247,23 @@ class ProjectFile(TimestampMixin, Base):
     file_type: Mapped[str | None] = mapped_column(String)
     storage_path: Mapped[str] = mapped_column(String, nullable=False)
 
-    project: Mapped[Project] = relationship(back_populates="files")
+    project: Mapped[Project] = relationship(back_populates="files", lazy="raise_on_sql")
 
 
 class CommentThread(TimestampMixin, Base):
+    # Stored with fillfactor=70 (set by migration) so resolution updates can be HOT updates.
     __tablename__ = "comment_threads"
     __table_args__ = (
-        Index("idx_comment_threads_project", "project_id"),
         Index("idx_comment_threads_view", "project_id", "view_id"),
+        Index(
+            "idx_comment_threads_annotation_gin",
+            "annotation",
+            postgresql_using="gin",
+            postgresql_ops={"annotation": "jsonb_path_ops"},
+        ),
     )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
@@ -190,36 +272,46 @@ class CommentThread(TimestampMixin, Base):
     created_by_id: Mapped[UUIDType | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
-    view_id: Mapped[str] = mapped_column(String, nullable=False)
+    view_id: Mapped[str] = mapped_column(String(100), nullable=False)
     pin_x: Mapped[float] = mapped_column(Float, nullable=False)
     pin_y: Mapped[float] = mapped_column(Float, nullable=False)
-    annotation: Mapped[dict | None] = mapped_column(JSON)
+    annotation: Mapped[dict | None] = mapped_column(JSONB)
     is_resolved: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     resolved_by_id: Mapped[UUIDType | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     resolved_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
 
-    project: Mapped[Project] = relationship(back_populates="comment_threads")
+    project: Mapped[Project] = relationship(back_populates="comment_threads", lazy="raise_on_sql")
     created_by: Mapped[User | None] = relationship(
-        back_populates="comment_threads", foreign_keys=[created_by_id]
+        back_populates="comment_threads", foreign_keys=[created_by_id], lazy="raise_on_sql"
     )
     resolved_by: Mapped[User | None] = relationship(
-        back_populates="resolved_comment_threads", foreign_keys=[resolved_by_id]
+        back_populates="resolved_comment_threads",
+        foreign_keys=[resolved_by_id],
+        lazy="raise_on_sql",
     )
     comments: Mapped[list["ThreadComment"]] = relationship(
         back_populates="thread",
         cascade="all, delete-orphan",
         order_by="ThreadComment.created_at",
+        lazy="selectin",
+        passive_deletes=True,
+    )
+    notifications: Mapped[list["Notification"]] = relationship(
+        back_populates="thread", lazy="raise_on_sql", passive_deletes=True
     )
-    notifications: Mapped[list["Notification"]] = relationship(back_populates="thread")
 
 
 class ThreadComment(TimestampMixin, Base):
     __tablename__ = "thread_comments"
-    __table_args__ = (Index("idx_thread_comments_thread", "thread_id"),)
+    __table_args__ = (
+        Index("idx_thread_comments_thread_created", "thread_id", "created_at"),
+        # Backs the parent_id ON DELETE CASCADE lookup when a comment is deleted.
+        Index("idx_thread_comments_parent", "parent_id"),
+    )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     thread_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("comment_threads.id", ondelete="CASCADE"),
@@ -237,14 +329,16 @@ class ThreadComment(TimestampMixin, Base):
     guest_email: Mapped[str | None] = mapped_column(String(255))
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
-    thread: Mapped[CommentThread] = relationship(back_populates="comments")
+    thread: Mapped[CommentThread] = relationship(back_populates="comments", lazy="raise_on_sql")
     author: Mapped[User | None] = relationship(
-        back_populates="thread_comments", foreign_keys=[author_id]
+        back_populates="thread_comments", foreign_keys=[author_id], lazy="raise_on_sql"
     )
     parent: Mapped["ThreadComment | None"] = relationship(
-        remote_side="ThreadComment.id", back_populates="replies"
+        remote_side="ThreadComment.id", back_populates="replies", lazy="raise_on_sql"
+    )
+    replies: Mapped[list["ThreadComment"]] = relationship(
+        back_populates="parent", lazy="raise_on_sql", passive_deletes=True
     )
-    replies: Mapped[list["ThreadComment"]] = relationship(back_populates="parent")
 
 
 class Notification(TimestampMixin, Base):
@@ -254,7 +348,7 @@ class Notification(TimestampMixin, Base):
         Index("idx_notifications_unread", "user_id", "is_read"),
     )
 
-    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUIDType] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[UUIDType] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
@@ -275,10 +369,14 @@ class Notification(TimestampMixin, Base):
     message: Mapped[str] = mapped_column(String, nullable=False)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    user: Mapped[User] = relationship(back_populates="notifications", foreign_keys=[user_id])
-    actor: Mapped[User | None] = relationship(foreign_keys=[actor_id])
-    project: Mapped[Project] = relationship(back_populates="notifications")
-    thread: Mapped[CommentThread | None] = relationship(back_populates="notifications")
+    user: Mapped[User] = relationship(
+        back_populates="notifications", foreign_keys=[user_id], lazy="raise_on_sql"
+    )
+    actor: Mapped[User | None] = relationship(foreign_keys=[actor_id], lazy="raise_on_sql")
+    project: Mapped[Project] = relationship(back_populates="notifications", lazy="raise_on_sql")
+    thread: Mapped[CommentThread | None] = relationship(
+        back_populates="notifications", lazy="raise_on_sql"
+    )
 
 
 __all__ = [
@@ -14,6 +14,20 @@ engine = create_async_engine(
     echo=False,
     pool_pre_ping=True,
     pool_recycle=1800,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    # Reuse the most recently returned connection so its prepared statements stay warm.
+    pool_use_lifo=True,
+    # Room for every ORM statement variant (loader options, relationship loads) so
+    # compiled SQL is never evicted from the cache.
+    query_cache_size=5000,
+    # asyncpg-level prepared statement caches, per connection. The queries are short OLTP
+    # lookups, so Postgres JIT compilation would cost more than it saves.
+    connect_args={
+        "prepared_statement_cache_size": 512,
+        "statement_cache_size": 1024,
+        "server_settings": {"jit": "off"},
+    },
 )
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
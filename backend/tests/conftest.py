@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from httpx import ASGITransport, AsyncClient
 
 # Add the backend directory to the Python path
 backend_dir = Path(__file__).parent.parent
@@ -22,3 +23,18 @@ os.environ.setdefault("STORAGE_LOCAL_BASE_PATH", "/tmp/test-storage")
 def anyio_backend():
     """Use asyncio backend for async tests."""
     return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Build the application once for the whole test session."""
+    from app.main import create_app
+
+    return create_app()
+
+
+@pytest.fixture
+async def client(app):
+    """HTTP client bound to the shared application."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
@@ -0,0 +1,93 @@
+"""Tests for the buffered analytics event writer."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture
+def inserts(monkeypatch):
+    """Replace the database write with a recorder that can be told to fail."""
+    from app.services import analytics
+
+    calls = []
+    failures = []
+
+    async def fake_insert(rows):
+        calls.append(list(rows))
+        if failures:
+            raise failures.pop(0)
+
+    monkeypatch.setattr(analytics, "_insert_events", fake_insert)
+    return calls, failures
+
+
+async def test_failed_batch_is_retried_on_next_flush(inserts):
+    """A batch that fails to insert stays queued and is written by a later flush."""
+    from app.services.analytics import AnalyticsEventBuffer
+
+    calls, failures = inserts
+    failures.append(ConnectionError("database unavailable"))
+    buffer = AnalyticsEventBuffer()
+    buffer.record(uuid4(), "project_view")
+
+    await buffer.flush()
+    await buffer.flush()
+
+    assert len(calls) == 2
+    assert calls[0] == calls[1]
+    assert buffer._pending == []
+
+
+async def test_batch_is_dropped_after_max_attempts(inserts, monkeypatch):
+    """A batch that keeps failing is eventually dropped so later events can proceed."""
+    from app.services import analytics
+
+    calls, failures = inserts
+    monkeypatch.setattr(analytics, "_MAX_INSERT_ATTEMPTS", 2)
+    failures.extend([ConnectionError("down"), ConnectionError("down")])
+    buffer = analytics.AnalyticsEventBuffer()
+    buffer.record(uuid4(), "project_view")
+
+    await buffer.flush()
+    await buffer.flush()
+
+    assert len(calls) == 2
+    assert buffer._pending == []
+
+
+def test_record_drops_events_once_queue_is_full(monkeypatch):
+    """Recording never grows the queue past its cap."""
+    from app.services import analytics
+
+    monkeypatch.setattr(analytics, "_MAX_PENDING_EVENTS", 2)
+    buffer = analytics.AnalyticsEventBuffer()
+    for _ in range(5):
+        buffer.record(uuid4(), "project_view")
+
+    assert len(buffer._pending) == 2
+
+
+async def test_stop_lets_in_flight_insert_finish(monkeypatch):
+    """Stopping waits for a running insert instead of cancelling it and losing the batch."""
+    from app.services import analytics
+
+    started = asyncio.Event()
+    written = []
+
+    async def slow_insert(rows):
+        started.set()
+        await asyncio.sleep(0.05)
+        written.extend(rows)
+
+    monkeypatch.setattr(analytics, "_insert_events", slow_insert)
+    buffer = analytics.AnalyticsEventBuffer(flush_interval=0.01)
+    buffer.record(uuid4(), "project_view")
+    buffer.start()
+    await started.wait()
+
+    await buffer.stop()
+
+    assert len(written) == 1
+    assert buffer._pending == []
@@ -0,0 +1,202 @@
+"""Tests for PCB layout preview rendering."""
+
+from pathlib import Path
+
+import pytest
+
+# Shapes as KiCad's SVG plotter writes them: one style group per layer colour.
+_OUTLINE = '<g style="stroke:#D0D200"><path d="M0 0 L100 0 L100 80 L0 80 Z"/></g>'
+_TRACK = '<g style="stroke:#C83434"><path d="M10 10 L90 10"/></g>'
+_EMPTY_GROUP = '<g style="fill:#C83434"></g>'
+
+
+def _svg(*groups: str) -> str:
+    return (
+        '<?xml version="1.0" standalone="no"?>\n'
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100mm" height="80mm">'
+        + "".join(groups)
+        + "</svg>"
+    )
+
+
+def _layer_svg(layer: str, common: list[str], empty: set[str]) -> str:
+    groups = [_OUTLINE if name == "Edge.Cuts" else _EMPTY_GROUP for name in common]
+    if layer not in common:
+        groups.append(_EMPTY_GROUP if layer in empty else _TRACK)
+    return _svg(*groups)
+
+
+@pytest.fixture
+def pcb_source(tmp_path: Path) -> Path:
+    source = tmp_path / "board.kicad_pcb"
+    source.write_text(
+        '(kicad_pcb (layers (0 "F.Cu" signal) (1 "In1.Cu" signal) (2 "In2.Cu" signal)'
+        ' (31 "B.Cu" signal)) (setup))'
+    )
+    (tmp_path / "out").mkdir()
+    return source
+
+
+@pytest.fixture
+def fake_cli(monkeypatch):
+    """Stub kicad-cli: plot the requested layers, leaving the layers in ``empty`` blank.
+
+    Multi-mode exports use KiCad's ``<board>-<layer>.svg`` naming, minus any layer listed in
+    ``skip_multi``; ``fail_multi`` makes the batched export exit with an error.
+    """
+    from app.services import previews
+
+    state = {"empty": set(), "skip_multi": set(), "fail_multi": False, "commands": []}
+
+    async def run_cli(command: list[str]) -> None:
+        state["commands"].append(command)
+        output = Path(command[command.index("--output") + 1])
+        layers = command[command.index("--layers") + 1].split(",")
+        if "--mode-multi" in command:
+            if state["fail_multi"]:
+                raise RuntimeError("kicad-cli exited with code 1")
+            common = command[command.index("--common-layers") + 1].split(",")
+            for layer in layers:
+                if layer not in state["skip_multi"]:
+                    name = f"board-{layer.replace('.', '_')}.svg"
+                    (output / name).write_text(_layer_svg(layer, common, state["empty"]))
+            return
+        groups = [
+            _OUTLINE if layer == "Edge.Cuts" else _TRACK
+            for layer in layers
+            if layer not in state["empty"] and layer != "User.Drawings"
+        ]
+        output.write_text(_svg(*groups))
+
+    monkeypatch.setattr(previews, "_run_cli", run_cli)
+    return state
+
+
+def test_outline_only_svg_is_not_plotted(tmp_path: Path):
+    """An inner layer whose plot holds only the board outline counts as empty."""
+    from app.services.previews import _count_svg_shapes, _is_plotted_svg
+
+    outline = tmp_path / "outline.svg"
+    outline.write_text(_svg(_OUTLINE, _EMPTY_GROUP))
+    empty_layer = tmp_path / "empty.svg"
+    empty_layer.write_text(_svg(_OUTLINE, _EMPTY_GROUP, _EMPTY_GROUP))
+    copper_layer = tmp_path / "copper.svg"
+    copper_layer.write_text(_svg(_OUTLINE, _EMPTY_GROUP, _TRACK))
+    baseline = _count_svg_shapes(outline)
+
+    assert _is_plotted_svg(empty_layer)
+    assert not _is_plotted_svg(empty_layer, baseline)
+    assert _is_plotted_svg(copper_layer, baseline)
+    assert not _is_plotted_svg(tmp_path / "missing.svg")
+
+
+async def test_empty_inner_layer_is_skipped(pcb_source: Path, fake_cli):
+    """A declared inner layer with nothing but the outline on it gets no preview."""
+    from app.services.previews import _render_board_svgs
+
+    fake_cli["empty"].add("In2.Cu")
+
+    entries, complete = await _render_board_svgs(pcb_source, pcb_source.parent / "out")
+
+    assert [entry["id"] for entry in entries] == ["front", "back", "inner-1"]
+    assert complete
+
+
+def _single_layer_exports(commands: list[list[str]]) -> list[str]:
+    return [
+        command[command.index("--layers") + 1] for command in commands if "--mode-single" in command
+    ]
+
+
+async def test_inner_layers_are_found_in_multi_mode_output(pcb_source: Path, fake_cli):
+    """Every inner layer is picked up from one batched export's ``<board>-InN_Cu.svg`` files."""
+    from app.services.previews import _render_board_svgs
+
+    output_dir = pcb_source.parent / "out"
+    entries, complete = await _render_board_svgs(pcb_source, output_dir)
+
+    assert [entry["id"] for entry in entries] == ["front", "back", "inner-1", "inner-2"]
+    assert complete
+    assert (output_dir / "inner-1.svg").read_text() == _layer_svg(
+        "In1.Cu", ["Edge.Cuts", "User.Drawings"], set()
+    )
+    multi = [command for command in fake_cli["commands"] if "--mode-multi" in command]
+    assert len(multi) == 1
+    assert not any("In" in layers for layers in _single_layer_exports(fake_cli["commands"]))
+
+
+async def test_missing_multi_mode_file_falls_back_to_single_export(pcb_source: Path, fake_cli):
+    """A layer absent from the batched output is exported on its own."""
+    from app.services.previews import _render_board_svgs
+
+    fake_cli["skip_multi"].add("In2.Cu")
+
+    entries, complete = await _render_board_svgs(pcb_source, pcb_source.parent / "out")
+
+    assert [entry["id"] for entry in entries] == ["front", "back", "inner-1", "inner-2"]
+    assert complete
+    single = _single_layer_exports(fake_cli["commands"])
+    assert "In2.Cu,Edge.Cuts,User.Drawings" in single
+    assert "In1.Cu,Edge.Cuts,User.Drawings" not in single
+
+
+async def test_failed_multi_mode_export_renders_layers_one_by_one(pcb_source: Path, fake_cli):
+    """If the batched export fails, each inner layer gets its own export."""
+    from app.services.previews import _render_board_svgs
+
+    fake_cli["fail_multi"] = True
+
+    entries, complete = await _render_board_svgs(pcb_source, pcb_source.parent / "out")
+
+    assert [entry["id"] for entry in entries] == ["front", "back", "inner-1", "inner-2"]
+    assert complete
+    single = _single_layer_exports(fake_cli["commands"])
+    assert {"In1.Cu,Edge.Cuts,User.Drawings", "In2.Cu,Edge.Cuts,User.Drawings"} <= set(single)
+
+
+async def _seed_render_cache(storage, cache_key: str) -> None:
+    from app.services.previews import _save_render_cache_manifest
+
+    await storage.save(f"render-cache/{cache_key}/layouts/front.svg", _svg(_TRACK).encode())
+    index = {"project": {}, "schematics": [], "layouts": [], "models": [], "photos": []}
+    await _save_render_cache_manifest(storage, cache_key, index, ["layouts/front.svg"])
+
+
+async def test_release_render_cache_evicts_the_projects_entry(tmp_path: Path):
+    """Deleting a project drops the cache entry its previews were restored from."""
+    from uuid import uuid4
+
+    from app.services.previews import _restore_cached_render, release_render_cache
+    from app.services.storage.local import LocalStorage
+
+    storage = LocalStorage(tmp_path)
+    project_id = uuid4()
+    await _seed_render_cache(storage, "abc123")
+
+    assert await _restore_cached_render(storage, project_id, "abc123")
+    await release_render_cache(storage, project_id)
+
+    assert not (tmp_path / "render-cache/abc123/index.json").exists()
+    assert not (tmp_path / "render-cache/abc123/layouts/front.svg").exists()
+    assert (tmp_path / f"projects/{project_id}/previews/layouts/front.svg").exists()
+    await storage.close()
+
+
+async def test_restore_reports_failure_when_index_write_fails(tmp_path: Path, monkeypatch):
+    """Copied assets without an index are useless, so the restore falls back to rendering."""
+    from uuid import uuid4
+
+    from app.services.previews import _restore_cached_render
+    from app.services.storage.base import StorageError
+    from app.services.storage.local import LocalStorage
+
+    storage = LocalStorage(tmp_path)
+    await _seed_render_cache(storage, "abc123")
+
+    async def failing_save(path, file_obj):
+        raise StorageError("disk full")
+
+    monkeypatch.setattr(storage, "save", failing_save)
+
+    assert not await _restore_cached_render(storage, uuid4(), "abc123")
+    await storage.close()
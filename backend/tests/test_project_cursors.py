@@ -0,0 +1,105 @@
+"""Tests for keyset pagination cursors on the project listing."""
+
+import base64
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+
+def _project(created_at: datetime):
+    from db.models import Project, uuid7
+
+    now = datetime.now(UTC)
+    return Project(
+        id=uuid7(),
+        owner_id=uuid7(),
+        name="Board",
+        is_public=True,
+        status="open",
+        source_type="kicad",
+        processing_status="completed",
+        view_count=0,
+        created_at=created_at,
+        updated_at=now,
+        files=[],
+        comment_threads=[],
+    )
+
+
+class _StubResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _StubSession:
+    """Returns canned rows for the single SELECT issued on the cursor path."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def execute(self, _query):
+        return _StubResult(self._rows)
+
+
+def test_cursor_round_trip():
+    """A cursor decodes back to the (created_at, id) key it was built from."""
+    from app.services.projects import _decode_cursor, _encode_cursor
+
+    project = _project(datetime(2025, 3, 1, 12, 30, tzinfo=UTC))
+
+    assert _decode_cursor(_encode_cursor(project)) == (project.created_at, project.id)
+
+
+async def test_cursor_page_links_to_next_page():
+    """A full page plus the probe row yields a cursor for the last returned item."""
+    from app.services.projects import _encode_cursor, list_projects
+
+    start = datetime(2025, 3, 1, tzinfo=UTC)
+    rows = [_project(start - timedelta(minutes=offset)) for offset in range(3)]
+    previous = _encode_cursor(_project(start + timedelta(minutes=1)))
+
+    response = await list_projects(_StubSession(rows), page=1, size=2, cursor=previous)
+
+    assert len(response.items) == 2
+    assert response.total is None
+    assert response.next_cursor == _encode_cursor(rows[1])
+
+
+async def test_cursor_last_page_has_no_next_cursor():
+    """Without a probe row beyond the page size, there is no following page."""
+    from app.services.projects import _encode_cursor, list_projects
+
+    start = datetime(2025, 3, 1, tzinfo=UTC)
+    rows = [_project(start - timedelta(minutes=offset)) for offset in range(2)]
+    previous = _encode_cursor(_project(start + timedelta(minutes=1)))
+
+    response = await list_projects(_StubSession(rows), page=1, size=2, cursor=previous)
+
+    assert len(response.items) == 2
+    assert response.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64",
+        base64.urlsafe_b64encode(b"{not json").decode("ascii"),
+        base64.urlsafe_b64encode(b'["2025-03-01T00:00:00+00:00"]').decode("ascii"),
+        base64.urlsafe_b64encode(b'["yesterday", "not-a-uuid"]').decode("ascii"),
+    ],
+)
+async def test_malformed_cursor_is_rejected(cursor):
+    """Cursors that are not base64 of an orjson (created_at, id) pair return 400."""
+    from app.services.projects import list_projects
+
+    with pytest.raises(HTTPException) as exc_info:
+        await list_projects(_StubSession([]), page=1, size=2, cursor=cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,107 @@
+"""Tests for SVG grid composition."""
+
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+_SVG = "{http://www.w3.org/2000/svg}"
+_XLINK = "{http://www.w3.org/1999/xlink}"
+
+
+def _compose(tmp_path: Path, *sheets: bytes) -> ET.Element:
+    from app.services.svg_utils import compose_svg_grid
+
+    destination = compose_svg_grid(list(sheets), tmp_path / "grid.svg")
+    return ET.parse(destination).getroot()
+
+
+def _viewports(root: ET.Element) -> list[ET.Element]:
+    return root.findall(f"{_SVG}svg")
+
+
+def test_namespaced_sheet_keeps_prefixed_attributes(tmp_path: Path):
+    """Namespace declarations on a sheet's root move onto its viewport."""
+    sheet = (
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+        b' width="100" height="50" viewBox="0 0 100 50">'
+        b'<defs><path id="p" d="M0 0 L10 10"/></defs><use xlink:href="#p"/></svg>\n'
+    )
+
+    (viewport,) = _viewports(_compose(tmp_path, sheet))
+
+    assert viewport.get("viewBox") == "0 0 100 50"
+    assert viewport.find(f"{_SVG}use").get(f"{_XLINK}href") == "#p"
+
+
+def test_greater_than_inside_root_attribute(tmp_path: Path):
+    """A quoted ">" in a root attribute does not end the start tag early."""
+    sheet = (
+        b'<svg xmlns="http://www.w3.org/2000/svg" data-note="a > b" width="20" height="10"'
+        b' style=\'stroke: black; /* > */\' viewBox="0 0 20 10"><rect width="5" height="5"/>'
+        b"</svg>"
+    )
+
+    (viewport,) = _viewports(_compose(tmp_path, sheet))
+
+    assert viewport.get("viewBox") == "0 0 20 10"
+    assert [child.tag for child in viewport] == [f"{_SVG}rect"]
+
+
+def test_non_utf8_sheet_uses_elementtree_fallback(tmp_path: Path):
+    """Sheets in other encodings are re-serialised, so their text survives as UTF-8."""
+    sheet = (
+        b'<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+        b'<svg xmlns="http://www.w3.org/2000/svg" width="30" height="20" viewBox="0 0 30 20">'
+        b"<text>Widerstand 10 k\xe9</text></svg>"
+    )
+
+    root = _compose(tmp_path, sheet)
+
+    (viewport,) = _viewports(root)
+    assert viewport.get("viewBox") == "0 0 30 20"
+    assert viewport.find(f"{_SVG}text").text == "Widerstand 10 ké"
+    assert (
+        (tmp_path / "grid.svg").read_bytes().startswith(b"<?xml version='1.0' encoding='utf-8'?>")
+    )
+
+
+def test_grid_places_each_sheet_in_its_own_viewport(tmp_path: Path):
+    """Sheets of different sizes land in equal cells of a 2x2 grid, in reading order."""
+    sheets = [
+        b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="50" viewBox="0 0 100 50">'
+        b'<rect width="100" height="50"/></svg>',
+        b'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+        b' width="200mm" height="100mm" viewBox="0 0 200 100">'
+        b'<use xlink:href="#a"/></svg>',
+        # No viewBox: the viewport falls back to the sheet's own width and height.
+        b'<svg xmlns="http://www.w3.org/2000/svg" width="150" height="120"><circle r="5"/></svg>',
+    ]
+
+    root = _compose(tmp_path, *sheets)
+
+    # Cells are the largest sheet (200 x 120) plus 5% padding: 210 x 126.
+    assert (float(root.get("width")), float(root.get("height"))) == (410.0, 246.0)
+    assert root.get("viewBox") == "0 0 410.0 246.0"
+    placements = [
+        tuple(float(viewport.get(name)) for name in ("x", "y", "width", "height"))
+        for viewport in _viewports(root)
+    ]
+    assert placements == [
+        (0.0, 0.0, 200.0, 120.0),
+        (210.0, 0.0, 200.0, 120.0),
+        (0.0, 126.0, 200.0, 120.0),
+    ]
+    assert [viewport.get("viewBox") for viewport in _viewports(root)] == [
+        "0 0 100 50",
+        "0 0 200 100",
+        "0 0 150.0 120.0",
+    ]
+    assert all(
+        viewport.get("preserveAspectRatio") == "xMidYMid meet" for viewport in _viewports(root)
+    )
+    assert _viewports(root)[1].find(f"{_SVG}use").get(f"{_XLINK}href") == "#a"
+    # The xlink declaration moves onto the second sheet's viewport rather than the grid root.
+    output = (tmp_path / "grid.svg").read_text()
+    root_tag, _, second_tag, _ = (tag.split(">", 1)[0] for tag in output.split("<svg ")[1:])
+    assert "xmlns:xlink" not in root_tag
+    assert 'xmlns:xlink="http://www.w3.org/1999/xlink"' in second_tag
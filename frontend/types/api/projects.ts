@@ -27,9 +27,11 @@ export interface Project {
 
 export interface ProjectListResponse {
   items: Project[]
-  total: number
+  // Null on cursor-paginated pages, which skip the count.
+  total: number | null
   page: number
   size: number
+  next_cursor?: string | null
 }
 
 export interface ProjectUploadResult {
@@ -86,6 +88,7 @@ export interface ProjectUpdatePayload {
 export interface ListProjectsQuery {
   page?: number
   size?: number
+  cursor?: string
   only_public?: boolean
   owner_id?: string
   status?: string